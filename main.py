@@ -1,16 +1,22 @@
 import sys
 import os
 import json
+import functools
+import re
+import time
+import multiprocessing
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QStackedWidget, QPushButton, QFileDialog, QMessageBox, QListWidget,
-    QListWidgetItem, QLabel, QFrame, QSplitter, QScrollArea, QLineEdit,
+    QListView, QAbstractItemView, QLabel, QFrame, QSplitter, QScrollArea, QLineEdit,
     QInputDialog, QProgressBar, QStatusBar, QGraphicsOpacityEffect,
-    QComboBox, QRadioButton, QButtonGroup, QDialog, QDialogButtonBox,
-    QCheckBox
+    QRadioButton, QButtonGroup, QDialog, QDialogButtonBox,
+    QCheckBox, QProgressDialog
 )
-from PySide6.QtCore import Qt, QSize, QBuffer, QIODevice, QPropertyAnimation, QEasingCurve, QTimer, QPoint
-from PySide6.QtGui import QIcon, QAction, QPixmap, QImage, QMouseEvent, QDragEnterEvent, QDropEvent, QKeySequence, QShortcut, QFont, QFontDatabase
+from PySide6.QtCore import Qt, QSize, QModelIndex, QAbstractListModel, QBuffer, QIODevice, QPropertyAnimation, QEasingCurve, QTimer, QPoint, QObject, QRunnable, QThreadPool, Signal, QRectF
+from PySide6.QtGui import QIcon, QAction, QPixmap, QPixmapCache, QImage, QMouseEvent, QDragEnterEvent, QDropEvent, QKeySequence, QShortcut, QFont, QFontDatabase, QPainter, QColor, QLinearGradient
 from scripts.pdf_engine import PDFEngine
 
 # Determine if running in a frozen state (PyInstaller)
@@ -32,6 +38,154 @@ def get_config_dir():
 # Configuration file path
 CONFIG_FILE = os.path.join(get_config_dir(), "config.json")
 
+# File dialogs start in the directory of the last file picked in any of them,
+# and only one is shown at a time so a double click can't stack two
+PDF_FILTER = "PDF Files (*.pdf)"
+_last_dir = ""
+_dialog_open = False
+
+def _remember_dir(path):
+    global _last_dir
+    if path:
+        _last_dir = path if os.path.isdir(path) else os.path.dirname(path)
+    return path
+
+def _single_dialog(empty):
+    """Decorator: return empty instead of opening a second dialog."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def guarded(*args, **kwargs):
+            global _dialog_open
+            if _dialog_open:
+                return empty
+            _dialog_open = True
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _dialog_open = False
+        return guarded
+    return wrap
+
+def _run_file_dialog(parent, title, mode, file_filter=None):
+    """Show the window's shared QFileDialog and return the selected paths.
+    
+    Each top-level window keeps one dialog that is reconfigured per use
+    instead of a new one being built for every pick.
+    """
+    window = parent.window() if parent is not None else None
+    dialog = getattr(window, "_file_dialog", None)
+    if dialog is None:
+        dialog = QFileDialog(window)
+        if window is not None:
+            window._file_dialog = dialog
+    dialog.setWindowTitle(title)
+    dialog.setFileMode(mode)
+    dialog.setAcceptMode(QFileDialog.AcceptSave if mode == QFileDialog.AnyFile
+                         else QFileDialog.AcceptOpen)
+    dialog.setOption(QFileDialog.ShowDirsOnly, mode == QFileDialog.Directory)
+    if file_filter:
+        dialog.setNameFilter(file_filter)
+    dialog.selectFile("")
+    if _last_dir:
+        dialog.setDirectory(_last_dir)
+    if not dialog.exec():
+        return []
+    return dialog.selectedFiles()
+
+@_single_dialog("")
+def open_file_dialog(parent, title, file_filter=PDF_FILTER):
+    paths = _run_file_dialog(parent, title, QFileDialog.ExistingFile, file_filter)
+    return _remember_dir(paths[0] if paths else "")
+
+@_single_dialog([])
+def open_files_dialog(parent, title, file_filter=PDF_FILTER):
+    paths = _run_file_dialog(parent, title, QFileDialog.ExistingFiles, file_filter)
+    if paths:
+        _remember_dir(paths[0])
+    return paths
+
+@_single_dialog("")
+def save_file_dialog(parent, title, file_filter=PDF_FILTER):
+    paths = _run_file_dialog(parent, title, QFileDialog.AnyFile, file_filter)
+    return _remember_dir(paths[0] if paths else "")
+
+@_single_dialog("")
+def directory_dialog(parent, title):
+    paths = _run_file_dialog(parent, title, QFileDialog.Directory)
+    return _remember_dir(paths[0] if paths else "")
+
+MB = 1024 * 1024
+
+PDF_EXTS = frozenset({'.pdf'})
+
+def dropped_pdfs(event):
+    """Local PDF paths from a drop event, without repeats, in drop order."""
+    files = (url.toLocalFile() for url in event.mimeData().urls())
+    return list(dict.fromkeys(f for f in files if os.path.splitext(f)[1].lower() in PDF_EXTS))
+
+def existing_paths(paths):
+    """The subset of paths that exist.
+    
+    Files sharing a folder are checked with one directory listing; a lone
+    file gets a plain stat, which is cheaper than listing a big folder.
+    """
+    by_dir = defaultdict(list)
+    for f in paths:
+        by_dir[os.path.dirname(f)].append(f)
+    
+    present = set()
+    for directory, files in by_dir.items():
+        if len(files) == 1:
+            if os.path.exists(files[0]):
+                present.add(files[0])
+            continue
+        try:
+            with os.scandir(directory or ".") as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            continue
+        present.update(f for f in files if os.path.basename(f) in names)
+    return present
+
+# Item data role holding a merge list entry's content digest
+DIGEST_ROLE = Qt.UserRole + 1
+
+def hash_file(path):
+    """BLAKE2b digest of a file's contents, or None if it can't be read."""
+    try:
+        return PDFEngine.fingerprint(path)
+    except OSError:
+        return None
+
+# Page selections like "1, 3-5, 7"
+_RANGES_RE = re.compile(r'\s*\d+\s*(?:-\s*\d+\s*)?(?:,\s*\d+\s*(?:-\s*\d+\s*)?)*')
+_RANGE_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+def parse_page_ranges(text):
+    """Sorted zero-based page indices for a 1-based selection like "1, 3-5, 7".
+    
+    Raises ValueError for malformed input, page 0 or reversed ranges.
+    """
+    if not _RANGES_RE.fullmatch(text):
+        raise ValueError(f"Invalid page selection: {text!r}")
+    spans = []
+    for m in _RANGE_RE.finditer(text):
+        start = int(m.group(1))
+        end = int(m.group(2)) if m.group(2) else start
+        if start < 1 or end < start:
+            raise ValueError(f"Invalid page range: {m.group(0)!r}")
+        spans.append((start - 1, end))
+    # Merge overlapping spans and expand each once, instead of hashing every page
+    spans.sort()
+    pages = []
+    stop = 0
+    for start, end in spans:
+        start = max(start, stop)
+        if start < end:
+            pages.extend(range(start, end))
+            stop = end
+    return pages
+
 # Enhanced modern stylesheet with gradients and animations
 STYLESHEET = """
 QMainWindow {
@@ -93,6 +247,207 @@ QProgressBar::chunk {
                                 stop:0 #3B82F6, stop:1 #2563EB);
     border-radius: 3px;
 }
+QFrame#ViewerToolbar {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                stop:0 #1A1A1D, stop:1 #161618);
+    border-bottom: 1px solid #2A2A2F;
+}
+QPushButton#ToolbarBtn {
+    background-color: #27272A;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    font-weight: bold;
+    padding: 8px;
+}
+QPushButton#ToolbarBtn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                stop:0 #3F3F46, stop:1 #27272A);
+}
+QPushButton#ToolbarBtn:pressed {
+    background-color: #18181B;
+}
+QPushButton#ToolbarBtn:checked {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #DC2626, stop:1 #B91C1C);
+}
+QPushButton#PrimaryBtn, QPushButton#SecondaryBtn, QPushButton#DangerBtn {
+    color: white;
+    padding: 12px 24px;
+    border-radius: 8px;
+    font-weight: bold;
+    font-size: 14px;
+    border: none;
+}
+QPushButton#PrimaryBtn {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #3B82F6, stop:1 #2563EB);
+}
+QPushButton#PrimaryBtn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #60A5FA, stop:1 #3B82F6);
+}
+QPushButton#SecondaryBtn {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #374151, stop:1 #27272A);
+}
+QPushButton#SecondaryBtn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #4B5563, stop:1 #374151);
+}
+QPushButton#DangerBtn {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #991B1B, stop:1 #7F1D1D);
+}
+QPushButton#DangerBtn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #B91C1C, stop:1 #991B1B);
+}
+QPushButton#SuccessBtn, QPushButton#WarningBtn {
+    color: white;
+    padding: 10px;
+    border-radius: 6px;
+    font-weight: bold;
+    border: none;
+    margin-top: 6px;
+}
+QPushButton#SuccessBtn {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #10B981, stop:1 #059669);
+}
+QPushButton#SuccessBtn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #34D399, stop:1 #10B981);
+}
+QPushButton#WarningBtn {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #F59E0B, stop:1 #D97706);
+}
+QPushButton#WarningBtn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #FBBF24, stop:1 #F59E0B);
+}
+QPushButton#PrimaryBtn:disabled, QPushButton#SecondaryBtn:disabled,
+QPushButton#DangerBtn:disabled, QPushButton#SuccessBtn:disabled,
+QPushButton#WarningBtn:disabled {
+    background-color: #27272A;
+    color: #6B7280;
+}
+QFrame#ToolCard {
+    padding: 20px;
+}
+QFrame#ToolCard QFrame {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                stop:0 #1A1A1D, stop:1 #161618);
+    border: 1px solid #2A2A2F;
+    border-radius: 12px;
+    padding: 20px;
+}
+QLabel#CardTitle {
+    color: white;
+    font-size: 16px;
+    font-weight: bold;
+}
+QLabel#CardDesc {
+    color: #9CA3AF;
+    font-size: 12px;
+    margin-bottom: 12px;
+}
+QPushButton#GridBtn {
+    color: white;
+    border-radius: 8px;
+    font-weight: bold;
+}
+QPushButton#GridBtn[accent="blue"] {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #3B82F6, stop:1 #1F2937);
+    border: 1px solid #3B82F6;
+}
+QPushButton#GridBtn[accent="blue"]:hover {
+    background: #3B82F6;
+}
+QPushButton#GridBtn[accent="green"] {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #10B981, stop:1 #1F2937);
+    border: 1px solid #10B981;
+}
+QPushButton#GridBtn[accent="green"]:hover {
+    background: #10B981;
+}
+QPushButton#GridBtn[accent="amber"] {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #F59E0B, stop:1 #1F2937);
+    border: 1px solid #F59E0B;
+}
+QPushButton#GridBtn[accent="amber"]:hover {
+    background: #F59E0B;
+}
+QLabel#FileLabelIdle, QLabel#FileLabelActive {
+    color: #6B7280;
+    padding: 16px;
+    background-color: #161618;
+    border-radius: 8px;
+    margin-top: 16px;
+}
+QLabel#FileLabelActive {
+    color: #10B981;
+}
+QLineEdit#ToolInput {
+    padding: 12px;
+    border-radius: 6px;
+    background-color: #27272A;
+    color: white;
+    border: 1px solid #3F3F46;
+    font-size: 13px;
+}
+QLineEdit#ToolInput[accent="purple"]:focus {
+    border: 1px solid #8B5CF6;
+}
+QLineEdit#ToolInput[accent="green"]:focus {
+    border: 1px solid #10B981;
+}
+QLineEdit#ToolInput[accent="amber"]:focus {
+    border: 1px solid #F59E0B;
+}
+QLabel#RecentLabel {
+    color: #9CA3AF;
+    font-size: 14px;
+    font-weight: bold;
+}
+QListWidget#RecentList {
+    background-color: transparent;
+    border: none;
+    color: #60A5FA;
+    font-size: 12px;
+}
+QListWidget#RecentList::item {
+    padding: 6px;
+}
+QListWidget#RecentList::item:hover {
+    background-color: #27272A;
+    border-radius: 4px;
+}
+QListView#MergeList {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                stop:0 #1A1A1D, stop:1 #161618);
+    border: 2px dashed #3F3F46;
+    color: white;
+    border-radius: 12px;
+    padding: 16px;
+    font-size: 13px;
+}
+QListView#MergeList::item {
+    padding: 12px;
+    border-radius: 6px;
+    margin: 4px 0;
+}
+QListView#MergeList::item:hover {
+    background-color: #27272A;
+}
+QListView#MergeList::item:selected {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 #3B82F6, stop:1 #2563EB);
+}
 """
 
 class RecentFilesManager:
@@ -100,40 +455,83 @@ class RecentFilesManager:
     
     def __init__(self, max_files=10):
         self.max_files = max_files
-        self.recent_files = []
+        # Most recently used last, so promoting a file is O(1)
+        self._mru = OrderedDict()
+        self._config = {}
+        # Short-lived result of get_recent_files
+        self._existing = None
+        self._existing_time = 0.0
+        # Writes are coalesced; see save()
+        self._dirty = False
+        self._save_pending = False
         self.load()
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
     
     def load(self):
         """Load recent files from config."""
         try:
             if os.path.exists(CONFIG_FILE):
                 with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    self.recent_files = config.get('recent_files', [])
+                    self._config = json.load(f)
+                    recent = self._config.get('recent_files', [])[:self.max_files]
+                    self._mru = OrderedDict.fromkeys(reversed(recent))
         except Exception as e:
             print(f"Error loading config: {e}")
-            self.recent_files = []
+            self._mru = OrderedDict()
     
     def save(self):
-        """Save recent files to config."""
+        """Schedule a save of recent files; a burst of changes is written once."""
+        self._dirty = True
+        if not self._save_pending:
+            self._save_pending = True
+            QTimer.singleShot(500, self.flush)
+    
+    def flush(self):
+        """Write recent files to config now if there are unsaved changes."""
+        self._save_pending = False
+        if not self._dirty:
+            return
+        self._dirty = False
         try:
-            config = {'recent_files': self.recent_files}
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+            self._config['recent_files'] = self.recent_files
+            # Write beside the config and swap in, so a crash never truncates it
+            tmp_path = CONFIG_FILE + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self._config, f)
+            os.replace(tmp_path, CONFIG_FILE)
         except Exception as e:
             print(f"Error saving config: {e}")
     
     def add_file(self, filepath):
         """Add a file to recent files list."""
-        if filepath in self.recent_files:
-            self.recent_files.remove(filepath)
-        self.recent_files.insert(0, filepath)
-        self.recent_files = self.recent_files[:self.max_files]
+        self._mru.pop(filepath, None)
+        self._mru[filepath] = None
+        while len(self._mru) > self.max_files:
+            self._mru.popitem(last=False)
+        self._existing = None
         self.save()
     
+    @property
+    def recent_files(self):
+        """Recent files, most recent first."""
+        return list(reversed(self._mru))
+    
     def get_recent_files(self):
-        """Get list of recent files that still exist."""
-        return [f for f in self.recent_files if os.path.exists(f)]
+        """Get list of recent files that still exist.
+        
+        The result is reused for a second unless the list changes.
+        """
+        now = time.monotonic()
+        if self._existing is not None and now - self._existing_time < 1.0:
+            return list(self._existing)
+        
+        recent = self.recent_files
+        present = existing_paths(recent)
+        self._existing = [f for f in recent if f in present]
+        self._existing_time = now
+        return list(self._existing)
 
 class Sidebar(QFrame):
     def __init__(self, parent=None):
@@ -163,26 +561,26 @@ class Sidebar(QFrame):
         layout.addSpacing(24)
         
         # Navigation buttons with icons
-        self.btn_view = QPushButton("📖  Document Viewer")
+        self.btn_view = icon_button("📖", "Document Viewer")
         self.btn_view.setCheckable(True)
         self.btn_view.setChecked(True)
         self.btn_view.setObjectName("SidebarBtn")
         self.btn_view.setToolTip("View and annotate PDF documents (Ctrl+1)")
         layout.addWidget(self.btn_view)
         
-        self.btn_merge = QPushButton("🔀  Merge PDFs")
+        self.btn_merge = icon_button("🔀", "Merge PDFs")
         self.btn_merge.setCheckable(True)
         self.btn_merge.setObjectName("SidebarBtn")
         self.btn_merge.setToolTip("Combine multiple PDFs into one (Ctrl+2)")
         layout.addWidget(self.btn_merge)
         
-        self.btn_split = QPushButton("✂️  Split PDF")
+        self.btn_split = icon_button("✂️", "Split PDF")
         self.btn_split.setCheckable(True)
         self.btn_split.setObjectName("SidebarBtn")
         self.btn_split.setToolTip("Split PDF into separate pages (Ctrl+3)")
         layout.addWidget(self.btn_split)
         
-        self.btn_tools = QPushButton("🛠️  PDF Tools")
+        self.btn_tools = icon_button("🛠️", "PDF Tools")
         self.btn_tools.setCheckable(True)
         self.btn_tools.setObjectName("SidebarBtn")
         self.btn_tools.setToolTip("Compress, convert, and organize (Ctrl+4)")
@@ -191,10 +589,290 @@ class Sidebar(QFrame):
         layout.addStretch()
         
         # Help button
-        self.btn_help = QPushButton("❓ Help & Manual")
+        self.btn_help = icon_button("❓", "Help & Manual")
         self.btn_help.setObjectName("SidebarBtn")
         self.btn_help.setToolTip("View features and usage guide")
         layout.addWidget(self.btn_help)
+        
+        self.btn_clear_cache = icon_button("🧹", "Clear Cache")
+        self.btn_clear_cache.setObjectName("SidebarBtn")
+        self.btn_clear_cache.setToolTip("Delete stored compression results")
+        layout.addWidget(self.btn_clear_cache)
+
+class RenderSignals(QObject):
+    """Signals emitted by RenderTask (QRunnable cannot emit by itself):
+    (key, pix, generation, page count)."""
+    finished = Signal(object, object, int, int)
+
+class RenderTask(QRunnable):
+    """Renders a single page off the GUI thread; pix is None if rendering failed."""
+    
+    def __init__(self, key, generation):
+        super().__init__()
+        self.key = key
+        self.generation = generation
+        self.signals = RenderSignals()
+    
+    def run(self):
+        path, page_num, zoom = self.key
+        try:
+            # Cached after the first call, so every render can report it
+            count = PDFEngine.get_page_count(path)
+            pix = PDFEngine.render_page(path, page_num, zoom)
+            PDFEngine.trim_store()
+        except Exception as e:
+            print(f"Error rendering page {page_num + 1}: {e}")
+            count, pix = 0, None
+        self.signals.finished.emit(self.key, pix, self.generation, count)
+
+class ThumbnailSignals(QObject):
+    """Signals emitted by ThumbnailTask."""
+    finished = Signal(str, object, object, int, int, int)
+
+class ThumbnailTask(QRunnable):
+    """Reads the page count and first-page thumbnail of a PDF off the GUI thread."""
+    
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = ThumbnailSignals()
+    
+    def run(self):
+        try:
+            count, samples, width, height, stride = PDFEngine.get_thumbnail(self.path)
+        except Exception as e:
+            print(f"Error reading {self.path}: {e}")
+            self.signals.finished.emit(self.path, None, None, 0, 0, 0)
+            return
+        self.signals.finished.emit(self.path, count, samples, width, height, stride)
+
+class HashSignals(QObject):
+    """Signals emitted by HashTask: (paths, digests)."""
+    finished = Signal(list, list)
+
+class HashTask(QRunnable):
+    """Hashes files off the GUI thread, reading several at once."""
+    
+    def __init__(self, paths):
+        super().__init__()
+        self.paths = paths
+        self.signals = HashSignals()
+    
+    def run(self):
+        with ThreadPoolExecutor() as executor:
+            digests = list(executor.map(hash_file, self.paths))
+        self.signals.finished.emit(self.paths, digests)
+
+class JobSignals(QObject):
+    """Signals emitted by JobTask: (ok, result or error message)."""
+    finished = Signal(bool, object)
+
+class JobTask(QRunnable):
+    """Runs a PDFEngine operation off the GUI thread."""
+    
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = JobSignals()
+    
+    def run(self):
+        try:
+            # PDFEngine serializes its own MuPDF calls; office and worker-process
+            # steps run alongside the viewer
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+            return
+        self.signals.finished.emit(True, result)
+
+# Tasks still running; keeps their signal objects alive until delivery
+_running_jobs = set()
+
+def run_job(parent, button, message, on_done, fn, *args):
+    """Run fn(*args) on the global thread pool behind a busy dialog.
+    
+    button is disabled until the job ends, then on_done(ok, result) is
+    called on the GUI thread.
+    """
+    progress = QProgressDialog(message, None, 0, 0, parent)
+    progress.setWindowTitle("Processing")
+    progress.setWindowModality(Qt.WindowModal)
+    progress.setCancelButton(None)
+    # Quick jobs finish before the dialog would even paint; only show it for slow ones
+    show_timer = QTimer(progress)
+    show_timer.setSingleShot(True)
+    show_timer.timeout.connect(progress.show)
+    show_timer.start(300)
+    button.setEnabled(False)
+    
+    task = JobTask(fn, *args)
+    _running_jobs.add(task)
+    
+    def finished(ok, result):
+        _running_jobs.discard(task)
+        show_timer.stop()
+        progress.close()
+        progress.deleteLater()
+        button.setEnabled(True)
+        on_done(ok, result)
+    
+    task.signals.finished.connect(finished)
+    QThreadPool.globalInstance().start(task)
+
+class FileListModel(QAbstractListModel):
+    """Plain list of file paths backing the merge list.
+    
+    Bulk adds are a single insert notification instead of one item object
+    per file. Per-file details (digest, page count, icon) are kept by path.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths = []
+        self._details = {}
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self._paths[index.row()]
+        if role == Qt.DisplayRole:
+            return path
+        details = self._details.get(path, {})
+        if role == Qt.DecorationRole:
+            return details.get('icon')
+        if role == Qt.ToolTipRole:
+            return details.get('tooltip')
+        if role == Qt.UserRole:
+            return details.get('pages')
+        if role == DIGEST_ROLE:
+            return details.get('digest')
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            # Dropping between rows only, never onto an item
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+    
+    def supportedDropActions(self):
+        return Qt.MoveAction
+    
+    def moveRows(self, source_parent, source_row, count, dest_parent, dest_child):
+        if source_parent.isValid() or dest_parent.isValid():
+            return False
+        if source_row <= dest_child <= source_row + count:
+            return False
+        if not self.beginMoveRows(source_parent, source_row, source_row + count - 1,
+                                  dest_parent, dest_child):
+            return False
+        moved = self._paths[source_row:source_row + count]
+        del self._paths[source_row:source_row + count]
+        if dest_child > source_row:
+            dest_child -= count
+        self._paths[dest_child:dest_child] = moved
+        self.endMoveRows()
+        return True
+    
+    def add_paths(self, paths, digests):
+        """Append paths with their content digests in one insert."""
+        if not paths:
+            return
+        first = len(self._paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(paths) - 1)
+        self._paths.extend(paths)
+        for path, digest in zip(paths, digests):
+            self._details[path] = {'digest': digest}
+        self.endInsertRows()
+    
+    def set_details(self, path, **details):
+        """Update stored details for path and refresh the rows showing it."""
+        self._details.setdefault(path, {}).update(details)
+        for row, p in enumerate(self._paths):
+            if p == path:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+    
+    def digests(self):
+        return {d.get('digest') for d in self._details.values()}
+    
+    def paths(self):
+        return list(self._paths)
+    
+    def clear(self):
+        self.beginResetModel()
+        self._paths.clear()
+        self._details.clear()
+        self.endResetModel()
+
+_emoji_icons = {}
+
+def emoji_icon(emoji, size=20):
+    """QIcon of an emoji, rendered once so buttons don't reshape color glyphs on every layout."""
+    icon = _emoji_icons.get(emoji)
+    if icon is None:
+        ratio = QApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(round(size * ratio), round(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        font = painter.font()
+        font.setPixelSize(size - 4)
+        painter.setFont(font)
+        painter.drawText(QRectF(0, 0, size, size), Qt.AlignCenter, emoji)
+        painter.end()
+        icon = _emoji_icons[emoji] = QIcon(pixmap)
+    return icon
+
+def icon_button(emoji, text):
+    """QPushButton with a plain text label and the emoji as its icon."""
+    btn = QPushButton(text)
+    btn.setIcon(emoji_icon(emoji))
+    return btn
+
+def make_toolbar_btn(text, width=40, tooltip=None):
+    """Viewer toolbar button; its look comes from QPushButton#ToolbarBtn in STYLESHEET."""
+    btn = QPushButton(text)
+    btn.setObjectName("ToolbarBtn")
+    btn.setFixedSize(width, 40)
+    btn.setToolTip(tooltip or text)
+    return btn
+
+class CardFrame(QFrame):
+    """Tool card that blits its gradient background from a cached pixmap.
+    
+    Padding still comes from QFrame#ToolCard in STYLESHEET; the background
+    and border are drawn here once per card size instead of on every paint.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("ToolCard")
+    
+    def paintEvent(self, event):
+        ratio = self.devicePixelRatioF()
+        key = f"ToolCard:{self.width()}x{self.height()}@{ratio}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            gradient = QLinearGradient(0, 0, 0, self.height())
+            gradient.setColorAt(0, QColor("#1A1A1D"))
+            gradient.setColorAt(1, QColor("#161618"))
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QColor("#2A2A2F"))
+            painter.setBrush(gradient)
+            painter.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.end()
 
 class PDFViewer(QWidget):
     def __init__(self, parent=None):
@@ -206,55 +884,24 @@ class PDFViewer(QWidget):
         # Toolbar with enhanced styling
         self.toolbar = QFrame()
         self.toolbar.setFixedHeight(60)
-        self.toolbar.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #1A1A1D, stop:1 #161618);
-                border-bottom: 1px solid #2A2A2F;
-            }
-            QPushButton {
-                background-color: #27272A;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-weight: bold;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #3F3F46, stop:1 #27272A);
-            }
-            QPushButton:pressed {
-                background-color: #18181B;
-            }
-            QPushButton:checked {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #DC2626, stop:1 #B91C1C);
-            }
-        """)
+        self.toolbar.setObjectName("ViewerToolbar")
         toolbar_layout = QHBoxLayout(self.toolbar)
         toolbar_layout.setContentsMargins(16, 8, 16, 8)
         
-        self.btn_prev = QPushButton("◀")
-        self.btn_next = QPushButton("▶")
+        self.btn_prev = make_toolbar_btn("◀")
+        self.btn_next = make_toolbar_btn("▶")
         self.page_label = QLabel("Page: 0 / 0")
         self.page_label.setStyleSheet("color: white; margin: 0 12px; font-weight: bold;")
         
-        self.btn_zoom_in = QPushButton("🔍+")
-        self.btn_zoom_out = QPushButton("🔍-")
-        self.btn_fit = QPushButton("⬜ Fit")
+        self.btn_zoom_in = make_toolbar_btn("🔍+")
+        self.btn_zoom_out = make_toolbar_btn("🔍-")
+        self.btn_fit = make_toolbar_btn("⬜ Fit")
         
         # Annotation Toggle
-        self.btn_annotate = QPushButton("✏️ Annotate")
+        self.btn_annotate = make_toolbar_btn("✏️ Annotate", width=100,
+                                             tooltip="Click to add text annotations")
         self.btn_annotate.setCheckable(True)
         
-        for btn in [self.btn_prev, self.btn_next, self.btn_zoom_in, self.btn_zoom_out, self.btn_fit]:
-            btn.setFixedSize(40, 40)
-            btn.setToolTip(btn.text())
-        
-        self.btn_annotate.setFixedSize(100, 40)
-        self.btn_annotate.setToolTip("Click to add text annotations")
-        
         toolbar_layout.addWidget(self.btn_prev)
         toolbar_layout.addWidget(self.page_label)
         toolbar_layout.addWidget(self.btn_next)
@@ -284,6 +931,32 @@ class PDFViewer(QWidget):
         self.total_pages = 0
         self.zoom_level = 2.0
         
+        # Rendered page cache: (path, page, render zoom) -> QPixmap, oldest first,
+        # bounded by pixel memory since page size grows with the square of zoom
+        self._pix_cache = OrderedDict()
+        self._pix_cache_bytes = 0
+        self._pix_cache_limit = 128 * MB
+        
+        # Page renders, current and neighbouring; the GUI thread never touches
+        # the shared document, so it never waits on the engine lock
+        self._render_pool = QThreadPool(self)
+        self._render_pool.setMaxThreadCount(1)
+        self._pending_renders = set()
+        # Bumped on every load so renders of a replaced document are dropped
+        self._generation = 0
+        
+        # Zoom shows a scaled copy of the last sharp render, then re-renders
+        self._shown_pixmap = None
+        self._shown_zoom = self.zoom_level
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.timeout.connect(self.display_page)
+        
+        # Coalesces bursts of page flips into a single render
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.timeout.connect(self.display_page)
+        
         # Connections
         self.btn_prev.clicked.connect(self.prev_page)
         self.btn_next.clicked.connect(self.next_page)
@@ -299,49 +972,154 @@ class PDFViewer(QWidget):
             event.acceptProposedAction()
 
     def dropEvent(self, event: QDropEvent):
-        files = [url.toLocalFile() for url in event.mimeData().urls()]
-        pdf_files = [f for f in files if f.lower().endswith('.pdf')]
+        pdf_files = dropped_pdfs(event)
         if pdf_files:
             self.load_pdf(pdf_files[0])
 
     def load_pdf(self, path):
+        # The page count arrives with the first render; nothing here waits on
+        # the engine, which a running job may be holding
+        self.total_pages = 0
+        self._pending_renders.clear()
+        self._render_pool.clear()
+        # Closed on the render thread, after any render still using it; get_doc
+        # reopens path itself if it changed on disk
+        if self.current_path and self.current_path != path:
+            previous = self.current_path
+            self._render_pool.start(lambda: PDFEngine.close_doc(previous))
         self.current_path = path
-        self.total_pages = PDFEngine.get_page_count(path)
         self.current_page = 0
+        self._pix_cache.clear()
+        self._pix_cache_bytes = 0
+        self._generation += 1
+        self._shown_pixmap = None
         self.display_page()
 
     def display_page(self):
         if not self.current_path:
             return
+        self._zoom_timer.stop()
+        self._render_timer.stop()
             
-        img_data = PDFEngine.render_page(self.current_path, self.current_page, self.zoom_level)
-        image = QImage.fromData(img_data)
-        pixmap = QPixmap.fromImage(image)
+        self.page_label.setText(f"Page: {self.current_page + 1} / {self.total_pages}")
+        key = self.current_key()
+        pixmap = self._pix_cache.get(key)
+        if pixmap is None:
+            # Shown by on_render_finished once the render thread delivers it
+            self.queue_render(key, priority=1)
+            return
+        self._pix_cache.move_to_end(key)
+        self.show_pixmap(pixmap)
+
+    def show_pixmap(self, pixmap):
+        self._shown_pixmap = pixmap
+        self._shown_zoom = self.zoom_level
         self.content_label.setPixmap(pixmap)
+        self.prefetch_neighbors()
+
+    def current_key(self):
+        return (self.current_path, self.current_page, self.render_zoom())
+
+    def pixmap_from_fitz(self, pix):
+        """Convert a fitz.Pixmap to a QPixmap, wrapping its samples without a copy."""
+        # The QImage borrows pix's memory; pix (held by this call) outlives it,
+        # and fromImage copies the pixels, so nothing needs to keep pix after
+        fmt = QImage.Format_Grayscale8 if pix.n == 1 else QImage.Format_RGB888
+        image = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, fmt)
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        return pixmap
+
+    def render_zoom(self):
+        """Zoom to render at: the user's zoom in device pixels, so HiDPI screens get a sharp page."""
+        return self.zoom_level * self.devicePixelRatioF()
+
+    def cache_pixmap(self, key, pixmap):
+        if key in self._pix_cache:
+            self._pix_cache_bytes -= self.pixmap_bytes(self._pix_cache.pop(key))
+        self._pix_cache[key] = pixmap
+        self._pix_cache_bytes += self.pixmap_bytes(pixmap)
+        # Always keep the newest entry, even if it alone is over the limit
+        while self._pix_cache_bytes > self._pix_cache_limit and len(self._pix_cache) > 1:
+            _, oldest = self._pix_cache.popitem(last=False)
+            self._pix_cache_bytes -= self.pixmap_bytes(oldest)
+
+    @staticmethod
+    def pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def prefetch_neighbors(self):
+        """Queue background renders for the pages either side of the current one."""
+        for page_num in (self.current_page + 1, self.current_page - 1):
+            if not 0 <= page_num < self.total_pages:
+                continue
+            key = (self.current_path, page_num, self.render_zoom())
+            if key not in self._pix_cache:
+                self.queue_render(key)
+
+    def queue_render(self, key, priority=0):
+        """Render key on the render thread unless it is already queued."""
+        if key in self._pending_renders:
+            return
+        self._pending_renders.add(key)
+        task = RenderTask(key, self._generation)
+        task.signals.finished.connect(self.on_render_finished)
+        self._render_pool.start(task, priority)
+
+    def on_render_finished(self, key, pix, generation, count):
+        if generation != self._generation:
+            return
+        self._pending_renders.discard(key)
+        if count and count != self.total_pages:
+            self.total_pages = count
+            self.page_label.setText(f"Page: {self.current_page + 1} / {self.total_pages}")
+        # Drop failures and results for a zoom level that is no longer shown
+        if pix is None or key[2] != self.render_zoom():
+            return
+        pixmap = self.pixmap_from_fitz(pix)
+        self.cache_pixmap(key, pixmap)
+        if key == self.current_key():
+            self.show_pixmap(pixmap)
+
+    def schedule_render(self):
+        """Update the page counter now and render once input settles."""
         self.page_label.setText(f"Page: {self.current_page + 1} / {self.total_pages}")
+        self._render_timer.start(50)
 
     def next_page(self):
         if self.current_page < self.total_pages - 1:
             self.current_page += 1
-            self.display_page()
+            self.schedule_render()
 
     def prev_page(self):
         if self.current_page > 0:
             self.current_page -= 1
+            self.schedule_render()
+
+    def set_zoom(self, zoom):
+        """Change zoom, showing a scaled preview until the sharp render is due."""
+        self.zoom_level = zoom
+        key = (self.current_path, self.current_page, self.render_zoom())
+        if self._shown_pixmap is None or key in self._pix_cache:
             self.display_page()
+            return
+        
+        # Nearest-neighbour is enough here: the sharp render replaces it shortly
+        factor = zoom / self._shown_zoom
+        preview = self._shown_pixmap.scaled(self._shown_pixmap.size() * factor,
+                                            Qt.KeepAspectRatio, Qt.FastTransformation)
+        self.content_label.setPixmap(preview)
+        self._zoom_timer.start(300)
 
     def zoom_in(self):
-        self.zoom_level += 0.5
-        self.display_page()
+        self.set_zoom(self.zoom_level + 0.5)
 
     def zoom_out(self):
         if self.zoom_level > 0.5:
-            self.zoom_level -= 0.5
-            self.display_page()
+            self.set_zoom(self.zoom_level - 0.5)
     
     def fit_to_window(self):
-        self.zoom_level = 1.5
-        self.display_page()
+        self.set_zoom(1.5)
             
     def handle_click(self, event: QMouseEvent):
         if not self.current_path or not self.btn_annotate.isChecked():
@@ -357,12 +1135,19 @@ class PDFViewer(QWidget):
         
         text, ok = QInputDialog.getText(self, "Add Annotation", "Enter text to add:")
         if ok and text:
-            output_path, _ = QFileDialog.getSaveFileName(self, "Save Annotated PDF", "", "PDF Files (*.pdf)")
+            output_path = save_file_dialog(self, "Save Annotated PDF")
             if output_path:
-                PDFEngine.add_text_annotation(self.current_path, self.current_page, text, pdf_x, pdf_y, output_path)
-                QMessageBox.information(self, "✅ Success", f"Annotation added successfully!\nSaved to: {output_path}")
-                self.load_pdf(output_path)
-                self.btn_annotate.setChecked(False)
+                def done(ok, result):
+                    if not ok:
+                        QMessageBox.critical(self, "❌ Error", f"Failed to add annotation.\n\nError: {result}")
+                        return
+                    QMessageBox.information(self, "✅ Success", f"Annotation added successfully!\nSaved to: {output_path}")
+                    self.load_pdf(output_path)
+                    self.btn_annotate.setChecked(False)
+                
+                run_job(self, self.btn_annotate, "Adding annotation...", done,
+                        PDFEngine.add_text_annotation, self.current_path, self.current_page,
+                        text, pdf_x, pdf_y, output_path)
 
 class MergeWidget(QWidget):
     def __init__(self, parent=None):
@@ -403,86 +1188,28 @@ class MergeWidget(QWidget):
         self.layout.addSpacing(16)
         
         # File list with enhanced styling
-        self.file_list = QListWidget()
-        self.file_list.setDragDropMode(QListWidget.InternalMove)
-        self.file_list.setStyleSheet("""
-            QListWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #1A1A1D, stop:1 #161618);
-                border: 2px dashed #3F3F46;
-                color: white;
-                border-radius: 12px;
-                padding: 16px;
-                font-size: 13px;
-            }
-            QListWidget::item {
-                padding: 12px;
-                border-radius: 6px;
-                margin: 4px 0;
-            }
-            QListWidget::item:hover {
-                background-color: #27272A;
-            }
-            QListWidget::item:selected {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #3B82F6, stop:1 #2563EB);
-            }
-        """)
+        self.file_model = FileListModel(self)
+        self.file_list = QListView()
+        self.file_list.setModel(self.file_model)
+        self.file_list.setDragDropMode(QAbstractItemView.InternalMove)
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.setIconSize(QSize(32, 42))
+        self.file_list.setObjectName("MergeList")
         self.layout.addWidget(self.file_list)
         
         # Buttons with enhanced styling
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(12)
         
-        self.btn_add = QPushButton("➕ Add Files")
-        self.btn_clear = QPushButton("🗑️ Clear All")
-        self.btn_merge = QPushButton("🔀 Merge & Save")
+        self.btn_add = icon_button("➕", "Add Files")
+        self.btn_clear = icon_button("🗑️", "Clear All")
+        self.btn_merge = icon_button("🔀", "Merge & Save")
         
         for btn in [self.btn_add, self.btn_clear, self.btn_merge]:
             btn.setFixedHeight(44)
-            btn.setStyleSheet("""
-                QPushButton {
-                    padding: 12px 24px;
-                    border-radius: 8px;
-                    font-weight: bold;
-                    font-size: 14px;
-                    border: none;
-                }
-            """)
-            
-        self.btn_add.setStyleSheet(self.btn_add.styleSheet() + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #374151, stop:1 #27272A);
-                color: white;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #4B5563, stop:1 #374151);
-            }
-        """)
-        self.btn_clear.setStyleSheet(self.btn_clear.styleSheet() + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #991B1B, stop:1 #7F1D1D);
-                color: white;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #B91C1C, stop:1 #991B1B);
-            }
-        """)
-        self.btn_merge.setStyleSheet(self.btn_merge.styleSheet() + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #3B82F6, stop:1 #2563EB);
-                color: white;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #60A5FA, stop:1 #3B82F6);
-            }
-        """)
+        self.btn_add.setObjectName("SecondaryBtn")
+        self.btn_clear.setObjectName("DangerBtn")
+        self.btn_merge.setObjectName("PrimaryBtn")
         
         self.btn_add.setToolTip("Add PDF files to merge (Ctrl+O)")
         self.btn_clear.setToolTip("Remove all files from the list")
@@ -497,42 +1224,99 @@ class MergeWidget(QWidget):
         self.btn_add.clicked.connect(self.add_files)
         self.btn_clear.clicked.connect(self.clear_with_confirmation)
         self.btn_merge.clicked.connect(self.merge_files)
+        
+        # Background page-count / thumbnail loading for added files
+        self._thumb_pool = QThreadPool(self)
+        self._thumb_pool.setMaxThreadCount(1)
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
 
     def dropEvent(self, event: QDropEvent):
-        files = [url.toLocalFile() for url in event.mimeData().urls()]
-        pdf_files = [f for f in files if f.lower().endswith('.pdf')]
+        pdf_files = dropped_pdfs(event)
         if pdf_files:
-            self.file_list.addItems(pdf_files)
+            self.add_paths(pdf_files)
 
     def add_files(self):
-        files, _ = QFileDialog.getOpenFileNames(self, "Select PDFs", "", "PDF Files (*.pdf)")
+        files = open_files_dialog(self, "Select PDFs")
         if files:
-            self.file_list.addItems(files)
+            self.add_paths(files)
+    
+    def add_paths(self, paths):
+        """Add files to the list, skipping duplicates, and load their details in the background."""
+        task = HashTask(list(paths))
+        task.signals.finished.connect(self.on_hashes_ready)
+        QThreadPool.globalInstance().start(task)
+    
+    def on_hashes_ready(self, paths, digests):
+        # Checked here rather than when queued, so overlapping drops still dedupe
+        seen = self.file_model.digests()
+        new_paths, new_digests, skipped = [], [], 0
+        for path, digest in zip(paths, digests):
+            if digest is not None and digest in seen:
+                skipped += 1
+                continue
+            seen.add(digest)
+            new_paths.append(path)
+            new_digests.append(digest)
+        self.file_model.add_paths(new_paths, new_digests)
+        
+        if skipped:
+            QMessageBox.information(self, "ℹ️ Duplicates Skipped",
+                                    f"Skipped {skipped} file{'s' if skipped != 1 else ''} already in the list.")
+        
+        for path in new_paths:
+            pixmap = QPixmapCache.find(path)
+            if pixmap is not None and not pixmap.isNull():
+                self.file_model.set_details(path, icon=QIcon(pixmap))
+            task = ThumbnailTask(path)
+            task.signals.finished.connect(self.on_thumbnail_ready)
+            self._thumb_pool.start(task)
+    
+    def on_thumbnail_ready(self, path, page_count, samples, width, height, stride):
+        if page_count is None:
+            self.file_model.set_details(path, tooltip="⚠️ Could not read this PDF")
+            return
+        
+        pixmap = QPixmap.fromImage(QImage(samples, width, height, stride, QImage.Format_RGB888))
+        QPixmapCache.insert(path, pixmap)
+        self.file_model.set_details(path, pages=page_count, icon=QIcon(pixmap),
+                                    tooltip=f"{page_count} page{'s' if page_count != 1 else ''}")
     
     def clear_with_confirmation(self):
-        if self.file_list.count() > 0:
+        if self.file_model.rowCount() > 0:
             reply = QMessageBox.question(self, "Confirm Clear", 
                                         "Are you sure you want to remove all files from the list?",
                                         QMessageBox.Yes | QMessageBox.No)
             if reply == QMessageBox.Yes:
-                self.file_list.clear()
+                self.file_model.clear()
 
     def merge_files(self):
-        if self.file_list.count() < 2:
+        if self.file_model.rowCount() < 2:
             QMessageBox.warning(self, "⚠️ Insufficient Files", 
                               "Please add at least 2 PDF files to merge.")
             return
             
-        output_path, _ = QFileDialog.getSaveFileName(self, "Save Merged PDF", "", "PDF Files (*.pdf)")
+        output_path = save_file_dialog(self, "Save Merged PDF")
         if output_path:
-            paths = [self.file_list.item(i).text() for i in range(self.file_list.count())]
-            if PDFEngine.merge_pdfs(paths, output_path):
-                QMessageBox.information(self, "✅ Success", 
-                                      f"Successfully merged {len(paths)} PDFs!\n\nSaved to:\n{output_path}")
+            paths = self.file_model.paths()
+            present = existing_paths(paths)
+            missing = [p for p in paths if p not in present]
+            if missing:
+                QMessageBox.warning(self, "⚠️ Missing Files",
+                                    "These files no longer exist:\n\n" + "\n".join(missing))
+                return
+            
+            def done(ok, result):
+                if ok and result:
+                    QMessageBox.information(self, "✅ Success", 
+                                          f"Successfully merged {len(paths)} PDFs!\n\nSaved to:\n{output_path}")
+                elif not ok:
+                    QMessageBox.critical(self, "❌ Error", f"Failed to merge PDFs.\n\nError: {result}")
+            
+            run_job(self, self.btn_merge, f"Merging {len(paths)} PDFs...", done,
+                    PDFEngine.merge_pdfs, paths, output_path)
 
 class SplitWidget(QWidget):
     def __init__(self, parent=None):
@@ -596,63 +1380,28 @@ class SplitWidget(QWidget):
         drop_text.setAlignment(Qt.AlignCenter)
         drop_layout.addWidget(drop_text)
         
-        self.btn_select = QPushButton("📂 Select PDF File")
+        self.btn_select = icon_button("📂", "Select PDF File")
         self.btn_select.setFixedSize(160, 44)
-        self.btn_select.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #374151, stop:1 #27272A);
-                color: white;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-weight: bold;
-                border: none;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #4B5563, stop:1 #374151);
-            }
-        """)
+        self.btn_select.setObjectName("SecondaryBtn")
         drop_layout.addWidget(self.btn_select, 0, Qt.AlignCenter)
         
         self.layout.addWidget(self.drop_zone)
         
         self.file_path_label = QLabel("No file selected")
-        self.file_path_label.setStyleSheet("""
-            color: #6B7280;
-            padding: 16px;
-            background-color: #161618;
-            border-radius: 8px;
-            margin-top: 16px;
-        """)
+        self.file_path_label.setObjectName("FileLabelIdle")
         self.file_path_label.setWordWrap(True)
         self.layout.addWidget(self.file_path_label)
         
         self.layout.addStretch()
         
+        self.zip_output = QCheckBox("Save pages as a single .zip archive")
+        self.zip_output.setStyleSheet("color: #E5E7EB; font-size: 13px; margin-bottom: 8px;")
+        self.layout.addWidget(self.zip_output)
+        
         # Split button
-        self.btn_split = QPushButton("✂️ Split into Pages")
+        self.btn_split = icon_button("✂️", "Split into Pages")
         self.btn_split.setFixedHeight(50)
-        self.btn_split.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #3B82F6, stop:1 #2563EB);
-                color: white;
-                padding: 16px;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 15px;
-                border: none;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #60A5FA, stop:1 #3B82F6);
-            }
-            QPushButton:disabled {
-                background-color: #27272A;
-                color: #6B7280;
-            }
-        """)
+        self.btn_split.setObjectName("PrimaryBtn")
         self.btn_split.setEnabled(False)
         self.btn_split.setToolTip("Select a PDF file first")
         self.layout.addWidget(self.btn_split)
@@ -666,33 +1415,47 @@ class SplitWidget(QWidget):
             event.acceptProposedAction()
 
     def dropEvent(self, event: QDropEvent):
-        files = [url.toLocalFile() for url in event.mimeData().urls()]
-        pdf_files = [f for f in files if f.lower().endswith('.pdf')]
+        pdf_files = dropped_pdfs(event)
         if pdf_files:
-            self.current_path = pdf_files[0]
-            self.file_path_label.setText(f"📄 {self.current_path}")
-            self.file_path_label.setStyleSheet(self.file_path_label.styleSheet().replace("#6B7280", "#10B981"))
-            self.btn_split.setEnabled(True)
-            self.btn_split.setToolTip("Split this PDF into individual pages")
+            self.set_file(pdf_files[0])
 
     def select_file(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select PDF", "", "PDF Files (*.pdf)")
+        path = open_file_dialog(self, "Select PDF")
         if path:
-            self.current_path = path
-            self.file_path_label.setText(f"📄 {path}")
-            self.file_path_label.setStyleSheet(self.file_path_label.styleSheet().replace("#6B7280", "#10B981"))
-            self.btn_split.setEnabled(True)
-            self.btn_split.setToolTip("Split this PDF into individual pages")
+            self.set_file(path)
+
+    def set_file(self, path):
+        self.current_path = path
+        self.file_path_label.setText(f"📄 {path}")
+        # Re-polish so the FileLabelActive rule from STYLESHEET applies
+        self.file_path_label.setObjectName("FileLabelActive")
+        self.file_path_label.style().unpolish(self.file_path_label)
+        self.file_path_label.style().polish(self.file_path_label)
+        self.btn_split.setEnabled(True)
+        self.btn_split.setToolTip("Split this PDF into individual pages")
 
     def split_file(self):
         if not self.current_path:
             return
-        output_dir = QFileDialog.getExistingDirectory(self, "Select Output Directory")
-        if output_dir:
-            if PDFEngine.split_pdf(self.current_path, output_dir):
-                page_count = PDFEngine.get_page_count(self.current_path)
+        path = self.current_path
+        if self.zip_output.isChecked():
+            output = save_file_dialog(self, "Save Pages As", "ZIP Archives (*.zip)")
+            if output and not output.endswith('.zip'): output += '.zip'
+            split = PDFEngine.split_pdf_to_zip
+        else:
+            output = directory_dialog(self, "Select Output Directory")
+            split = PDFEngine.split_pdf
+        if not output:
+            return
+        
+        def done(ok, result):
+            if ok and result:
                 QMessageBox.information(self, "✅ Success", 
-                                      f"PDF successfully split into {page_count} pages!\n\nSaved to:\n{output_dir}")
+                                      f"PDF successfully split into {result} pages!\n\nSaved to:\n{output}")
+            elif not ok:
+                QMessageBox.critical(self, "❌ Error", f"Failed to split PDF.\n\nError: {result}")
+        
+        run_job(self, self.btn_split, "Splitting PDF...", done, split, path, output)
 
 class MetadataDialog(QDialog):
     """Dialog to display PDF metadata information."""
@@ -945,6 +1708,7 @@ class HelpDialog(QDialog):
 class ToolsWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setUpdatesEnabled(False)
         
         # Main scroll area for vertical scrollability
         scroll = QScrollArea()
@@ -955,6 +1719,7 @@ class ToolsWidget(QWidget):
         content_widget = QWidget()
         self.layout = QVBoxLayout(content_widget)
         self.layout.setContentsMargins(24, 24, 24, 24)
+        self.layout.setSpacing(16)
         
         scroll.setWidget(content_widget)
         
@@ -965,7 +1730,7 @@ class ToolsWidget(QWidget):
         # Header
         header = QWidget()
         header_layout = QVBoxLayout(header)
-        header_layout.setContentsMargins(0, 0, 0, 0)
+        header_layout.setContentsMargins(0, 0, 0, 4)
         header_layout.setSpacing(8)
         
         self.title = QLabel("🛠️ PDF Tools & Utilities")
@@ -977,7 +1742,6 @@ class ToolsWidget(QWidget):
         header_layout.addWidget(self.subtitle)
         
         self.layout.addWidget(header)
-        self.layout.addSpacing(20)
         
         # Compression Section
         self.comp_card = self.create_tool_card(
@@ -988,7 +1752,6 @@ class ToolsWidget(QWidget):
         )
         self.btn_compress = self.comp_card.findChild(QPushButton)
         self.layout.addWidget(self.comp_card)
-        self.layout.addSpacing(16)
         
         # Image Conversion Section
         self.img_card = self.create_tool_card(
@@ -998,48 +1761,51 @@ class ToolsWidget(QWidget):
             "Convert to Images"
         )
         self.btn_convert = self.img_card.findChild(QPushButton)
+        self.images_zip = QCheckBox("Save images as a single .zip archive")
+        self.images_zip.setStyleSheet("color: #E5E7EB; font-size: 13px;")
+        self.img_card.layout().insertWidget(2, self.images_zip)
         self.layout.addWidget(self.img_card)
-        self.layout.addSpacing(16)
         
-        # Watermark Section
-        self.watermark_card = QFrame()
-        self.watermark_card.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #1A1A1D, stop:1 #161618);
-                border: 1px solid #2A2A2F;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
-        watermark_layout = QVBoxLayout(self.watermark_card)
-        
-        watermark_title = QLabel("💧 Add Watermark")
-        watermark_title.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
-        watermark_layout.addWidget(watermark_title)
+        self.current_path = None
+        self.btn_compress.clicked.connect(self.run_compression)
+        self.btn_convert.clicked.connect(self.run_conversion)
         
-        watermark_desc = QLabel("Add custom text watermark to all pages")
-        watermark_desc.setStyleSheet("color: #9CA3AF; font-size: 12px; margin-bottom: 12px;")
-        watermark_layout.addWidget(watermark_desc)
+        # The remaining cards sit below the fold; build them one per event
+        # loop pass so the tab shows up without waiting on all of them.
+        self._built = set()
+        self._pending_cards = ["watermark", "security", "rotation", "extract", "metadata", "office", "pages"]
+        QTimer.singleShot(0, self._build_next_card)
+        self.setUpdatesEnabled(True)
+    
+    def _build_next_card(self):
+        self._build_card(self._pending_cards.pop(0))
+        if self._pending_cards:
+            QTimer.singleShot(0, self._build_next_card)
+        else:
+            self.layout.addStretch()
+    
+    def _build_card(self, name):
+        if name in self._built:
+            return
+        self._built.add(name)
+        # Hold repaints so the card's widgets land in a single layout pass
+        self.setUpdatesEnabled(False)
+        try:
+            getattr(self, f"_build_{name}_card")()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _build_watermark_card(self):
+        # Watermark Section
+        self.watermark_card, watermark_layout = self.new_card("💧 Add Watermark", "Add custom text watermark to all pages")
         
         self.watermark_input = QLineEdit()
         self.watermark_input.setPlaceholderText("Enter watermark text (e.g., CONFIDENTIAL)")
-        self.watermark_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border-radius: 6px;
-                background-color: #27272A;
-                color: white;
-                border: 1px solid #3F3F46;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #8B5CF6;
-            }
-        """)
+        self.watermark_input.setObjectName("ToolInput")
+        self.watermark_input.setProperty("accent", "purple")
         watermark_layout.addWidget(self.watermark_input)
         
-        self.btn_watermark = QPushButton("💧 Apply Watermark")
+        self.btn_watermark = icon_button("💧", "Apply Watermark")
         self.btn_watermark.setFixedHeight(44)
         self.btn_watermark.setStyleSheet("""
             QPushButton {
@@ -1059,28 +1825,11 @@ class ToolsWidget(QWidget):
         """)
         watermark_layout.addWidget(self.btn_watermark)
         self.layout.addWidget(self.watermark_card)
-        self.layout.addSpacing(16)
-        
+        self.btn_watermark.clicked.connect(self.run_watermark)
+    
+    def _build_security_card(self):
         # Security Section (Encryption/Decryption)
-        self.security_card = QFrame()
-        self.security_card.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #1A1A1D, stop:1 #161618);
-                border: 1px solid #2A2A2F;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
-        security_layout = QVBoxLayout(self.security_card)
-        
-        security_title = QLabel("🔒 PDF Security")
-        security_title.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
-        security_layout.addWidget(security_title)
-        
-        security_desc = QLabel("Protect or unlock PDFs with password encryption")
-        security_desc.setStyleSheet("color: #9CA3AF; font-size: 12px; margin-bottom: 12px;")
-        security_layout.addWidget(security_desc)
+        self.security_card, security_layout = self.new_card("🔒 PDF Security", "Protect or unlock PDFs with password encryption")
         
         # Encryption subsection
         encrypt_label = QLabel("🔒 Encrypt PDF")
@@ -1090,39 +1839,13 @@ class ToolsWidget(QWidget):
         self.encrypt_password = QLineEdit()
         self.encrypt_password.setPlaceholderText("Enter password for encryption")
         self.encrypt_password.setEchoMode(QLineEdit.Password)
-        self.encrypt_password.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border-radius: 6px;
-                background-color: #27272A;
-                color: white;
-                border: 1px solid #3F3F46;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #10B981;
-            }
-        """)
+        self.encrypt_password.setObjectName("ToolInput")
+        self.encrypt_password.setProperty("accent", "green")
         security_layout.addWidget(self.encrypt_password)
         
-        self.btn_encrypt = QPushButton("🔒 Encrypt PDF")
+        self.btn_encrypt = icon_button("🔒", "Encrypt PDF")
         self.btn_encrypt.setFixedHeight(40)
-        self.btn_encrypt.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #10B981, stop:1 #059669);
-                color: white;
-                padding: 10px;
-                border-radius: 6px;
-                font-weight: bold;
-                border: none;
-                margin-top: 6px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #34D399, stop:1 #10B981);
-            }
-        """)
+        self.btn_encrypt.setObjectName("SuccessBtn")
         security_layout.addWidget(self.btn_encrypt)
         
         # Decryption subsection
@@ -1133,95 +1856,37 @@ class ToolsWidget(QWidget):
         self.decrypt_password = QLineEdit()
         self.decrypt_password.setPlaceholderText("Enter password to unlock")
         self.decrypt_password.setEchoMode(QLineEdit.Password)
-        self.decrypt_password.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border-radius: 6px;
-                background-color: #27272A;
-                color: white;
-                border: 1px solid #3F3F46;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #F59E0B;
-            }
-        """)
+        self.decrypt_password.setObjectName("ToolInput")
+        self.decrypt_password.setProperty("accent", "amber")
         security_layout.addWidget(self.decrypt_password)
         
-        self.btn_decrypt = QPushButton("🔓 Decrypt PDF")
+        self.btn_decrypt = icon_button("🔓", "Decrypt PDF")
         self.btn_decrypt.setFixedHeight(40)
-        self.btn_decrypt.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #F59E0B, stop:1 #D97706);
-                color: white;
-                padding: 10px;
-                border-radius: 6px;
-                font-weight: bold;
-                border: none;
-                margin-top: 6px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #FBBF24, stop:1 #F59E0B);
-            }
-        """)
+        self.btn_decrypt.setObjectName("WarningBtn")
         security_layout.addWidget(self.btn_decrypt)
         self.layout.addWidget(self.security_card)
-        self.layout.addSpacing(16)
-        
+        self.btn_encrypt.clicked.connect(self.run_encrypt)
+        self.btn_decrypt.clicked.connect(self.run_decrypt)
+    
+    def _build_rotation_card(self):
         # Page Rotation Section
-        self.rotation_card = QFrame()
-        self.rotation_card.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #1A1A1D, stop:1 #161618);
-                border: 1px solid #2A2A2F;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
-        rotation_layout = QVBoxLayout(self.rotation_card)
-        
-        rotation_title = QLabel("🔄 Rotate Pages")
-        rotation_title.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
-        rotation_layout.addWidget(rotation_title)
-        
-        rotation_desc = QLabel("Rotate specific pages or entire document")
-        rotation_desc.setStyleSheet("color: #9CA3AF; font-size: 12px; margin-bottom: 12px;")
-        rotation_layout.addWidget(rotation_desc)
+        self.rotation_card, rotation_layout = self.new_card("🔄 Rotate Pages", "Rotate specific pages or entire document")
         
         # Rotation angle selector
         angle_label = QLabel("Rotation Angle:")
         angle_label.setStyleSheet("color: #E5E7EB; font-size: 13px; margin-top: 4px;")
         rotation_layout.addWidget(angle_label)
         
-        self.rotation_angle = QComboBox()
-        self.rotation_angle.addItems(["90° Clockwise", "180°", "270° Clockwise"])
-        self.rotation_angle.setStyleSheet("""
-            QComboBox {
-                padding: 10px;
-                border-radius: 6px;
-                background-color: #27272A;
-                color: white;
-                border: 1px solid #3F3F46;
-                font-size: 13px;
-            }
-            QComboBox:hover {
-                border: 1px solid #EC4899;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #27272A;
-                color: white;
-                selection-background-color: #EC4899;
-                border: 1px solid #3F3F46;
-            }
-        """)
-        rotation_layout.addWidget(self.rotation_angle)
+        # Three fixed angles; the button ids are the degrees passed to the engine
+        self.rotation_angle = QButtonGroup(self)
+        angle_row = QHBoxLayout()
+        for degrees, text in ((90, "90° Clockwise"), (180, "180°"), (270, "270° Clockwise")):
+            radio = QRadioButton(text)
+            radio.setStyleSheet("color: #E5E7EB; font-size: 13px;")
+            self.rotation_angle.addButton(radio, degrees)
+            angle_row.addWidget(radio)
+        self.rotation_angle.button(90).setChecked(True)
+        rotation_layout.addLayout(angle_row)
         
         # All pages checkbox
         self.rotate_all_pages = QCheckBox("Rotate all pages")
@@ -1246,7 +1911,7 @@ class ToolsWidget(QWidget):
         """)
         rotation_layout.addWidget(self.rotate_all_pages)
         
-        self.btn_rotate = QPushButton("🔄 Rotate Pages")
+        self.btn_rotate = icon_button("🔄", "Rotate Pages")
         self.btn_rotate.setFixedHeight(44)
         self.btn_rotate.setStyleSheet("""
             QPushButton {
@@ -1266,30 +1931,13 @@ class ToolsWidget(QWidget):
         """)
         rotation_layout.addWidget(self.btn_rotate)
         self.layout.addWidget(self.rotation_card)
-        self.layout.addSpacing(16)
-        
+        self.btn_rotate.clicked.connect(self.run_rotation)
+    
+    def _build_extract_card(self):
         # Text Extraction Section
-        self.extract_card = QFrame()
-        self.extract_card.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #1A1A1D, stop:1 #161618);
-                border: 1px solid #2A2A2F;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
-        extract_layout = QVBoxLayout(self.extract_card)
-        
-        extract_title = QLabel("📝 Extract Text")
-        extract_title.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
-        extract_layout.addWidget(extract_title)
+        self.extract_card, extract_layout = self.new_card("📝 Extract Text", "Extract text content and save to .txt file")
         
-        extract_desc = QLabel("Extract text content and save to .txt file")
-        extract_desc.setStyleSheet("color: #9CA3AF; font-size: 12px; margin-bottom: 12px;")
-        extract_layout.addWidget(extract_desc)
-        
-        self.btn_extract = QPushButton("📝 Extract to TXT")
+        self.btn_extract = icon_button("📝", "Extract to TXT")
         self.btn_extract.setFixedHeight(44)
         self.btn_extract.setStyleSheet("""
             QPushButton {
@@ -1308,30 +1956,13 @@ class ToolsWidget(QWidget):
         """)
         extract_layout.addWidget(self.btn_extract)
         self.layout.addWidget(self.extract_card)
-        self.layout.addSpacing(16)
-        
+        self.btn_extract.clicked.connect(self.run_text_extraction)
+    
+    def _build_metadata_card(self):
         # Metadata Viewer Section
-        self.metadata_card = QFrame()
-        self.metadata_card.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #1A1A1D, stop:1 #161618);
-                border: 1px solid #2A2A2F;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
-        metadata_layout = QVBoxLayout(self.metadata_card)
+        self.metadata_card, metadata_layout = self.new_card("ℹ️ PDF Information", "View document properties and metadata")
         
-        metadata_title = QLabel("ℹ️ PDF Information")
-        metadata_title.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
-        metadata_layout.addWidget(metadata_title)
-        
-        metadata_desc = QLabel("View document properties and metadata")
-        metadata_desc.setStyleSheet("color: #9CA3AF; font-size: 12px; margin-bottom: 12px;")
-        metadata_layout.addWidget(metadata_desc)
-        
-        self.btn_metadata = QPushButton("ℹ️ View PDF Info")
+        self.btn_metadata = icon_button("ℹ️", "View PDF Info")
         self.btn_metadata.setFixedHeight(44)
         self.btn_metadata.setStyleSheet("""
             QPushButton {
@@ -1350,63 +1981,33 @@ class ToolsWidget(QWidget):
         """)
         metadata_layout.addWidget(self.btn_metadata)
         self.layout.addWidget(self.metadata_card)
-        self.layout.addSpacing(16)
-        
+        self.btn_metadata.clicked.connect(self.show_metadata)
+    
+    def _build_office_card(self):
         # Office Conversion Section
-        self.office_card = QFrame()
-        self.office_card.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #1A1A1D, stop:1 #161618);
-                border: 1px solid #2A2A2F;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
-        office_layout = QVBoxLayout(self.office_card)
-        
-        office_title = QLabel("📄 Office Conversion")
-        office_title.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
-        office_layout.addWidget(office_title)
-        
-        office_desc = QLabel("Convert between PDF and Word, Excel, PowerPoint")
-        office_desc.setStyleSheet("color: #9CA3AF; font-size: 12px; margin-bottom: 12px;")
-        office_layout.addWidget(office_desc)
+        self.office_card, office_layout = self.new_card("📄 Office Conversion", "Convert between PDF and Word, Excel, PowerPoint")
         
         # Grid of buttons
-        grid_layout = QHBoxLayout() # Use HBox for columns or Grid
-        # Let's use a Grid for 2 columns
-        from PySide6.QtWidgets import QGridLayout
+        # Two columns: PDF → format, format → PDF
         grid = QGridLayout()
         grid.setSpacing(12)
         
-        # Helper to create styled buttons for this grid
-        def create_grid_btn(text, color):
+        # Helper to create buttons for this grid, styled by accent in STYLESHEET
+        def create_grid_btn(text, accent):
             btn = QPushButton(text)
             btn.setFixedHeight(44)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                                stop:0 {color}, stop:1 #1F2937);
-                    color: white;
-                    border-radius: 8px;
-                    font-weight: bold;
-                    border: 1px solid {color};
-                }}
-                QPushButton:hover {{
-                    background: {color};
-                }}
-            """)
+            btn.setObjectName("GridBtn")
+            btn.setProperty("accent", accent)
             return btn
             
-        self.btn_pdf_word = create_grid_btn("PDF → Word", "#3B82F6")
-        self.btn_word_pdf = create_grid_btn("Word → PDF", "#3B82F6")
+        self.btn_pdf_word = create_grid_btn("PDF → Word", "blue")
+        self.btn_word_pdf = create_grid_btn("Word → PDF", "blue")
         
-        self.btn_pdf_excel = create_grid_btn("PDF → Excel", "#10B981")
-        self.btn_excel_pdf = create_grid_btn("Excel → PDF", "#10B981")
+        self.btn_pdf_excel = create_grid_btn("PDF → Excel", "green")
+        self.btn_excel_pdf = create_grid_btn("Excel → PDF", "green")
         
-        self.btn_pdf_ppt = create_grid_btn("PDF → PPT", "#F59E0B")
-        self.btn_ppt_pdf = create_grid_btn("PPT → PDF", "#F59E0B")
+        self.btn_pdf_ppt = create_grid_btn("PDF → PPT", "amber")
+        self.btn_ppt_pdf = create_grid_btn("PPT → PDF", "amber")
         
         grid.addWidget(self.btn_pdf_word, 0, 0)
         grid.addWidget(self.btn_word_pdf, 0, 1)
@@ -1417,118 +2018,69 @@ class ToolsWidget(QWidget):
         
         office_layout.addLayout(grid)
         self.layout.addWidget(self.office_card)
-        self.layout.addSpacing(16)
-        
+        for key, button in (("pdf_word", self.btn_pdf_word), ("word_pdf", self.btn_word_pdf),
+                            ("pdf_excel", self.btn_pdf_excel), ("excel_pdf", self.btn_excel_pdf),
+                            ("pdf_ppt", self.btn_pdf_ppt), ("ppt_pdf", self.btn_ppt_pdf)):
+            button.clicked.connect(lambda _=False, k=key, b=button: self.run_office_conversion(k, b))
+    
+    def _build_pages_card(self):
         # Page Organization Section
-        self.rem_card = QFrame()
-        self.rem_card.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #1A1A1D, stop:1 #161618);
-                border: 1px solid #2A2A2F;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
-        rem_layout = QVBoxLayout(self.rem_card)
-        
-        rem_title = QLabel("📑 Page Organization")
-        rem_title.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
-        rem_layout.addWidget(rem_title)
-        
-        rem_desc = QLabel("Keep specific pages, remove others")
-        rem_desc.setStyleSheet("color: #9CA3AF; font-size: 12px; margin-bottom: 12px;")
-        rem_layout.addWidget(rem_desc)
+        self.rem_card, rem_layout = self.new_card("📑 Page Organization", "Keep specific pages, remove others")
         
         self.pages_input = QLineEdit()
         self.pages_input.setPlaceholderText("Enter pages to keep (e.g., 1, 3-5, 7)")
-        self.pages_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border-radius: 6px;
-                background-color: #27272A;
-                color: white;
-                border: 1px solid #3F3F46;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #F59E0B;
-            }
-        """)
+        self.pages_input.setObjectName("ToolInput")
+        self.pages_input.setProperty("accent", "amber")
         rem_layout.addWidget(self.pages_input)
         
-        self.btn_remove = QPushButton("📑 Extract Pages")
+        self.btn_remove = icon_button("📑", "Extract Pages")
         self.btn_remove.setFixedHeight(44)
-        self.btn_remove.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #F59E0B, stop:1 #D97706);
-                color: white;
-                padding: 12px;
-                border-radius: 8px;
-                font-weight: bold;
-                border: none;
-                margin-top: 8px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #FBBF24, stop:1 #F59E0B);
-            }
-        """)
+        self.btn_remove.setObjectName("WarningBtn")
         rem_layout.addWidget(self.btn_remove)
         self.layout.addWidget(self.rem_card)
-        
-        self.layout.addStretch()
-        
-        self.current_path = None
-        self.btn_compress.clicked.connect(self.run_compression)
-        self.btn_convert.clicked.connect(self.run_conversion)
         self.btn_remove.clicked.connect(self.run_remove_pages)
-        
-        # Conversion Connections
-        self.btn_pdf_word.clicked.connect(self.run_pdf_to_word)
-        self.btn_word_pdf.clicked.connect(self.run_word_to_pdf)
-        self.btn_pdf_excel.clicked.connect(self.run_pdf_to_excel)
-        self.btn_excel_pdf.clicked.connect(self.run_excel_to_pdf)
-        self.btn_pdf_ppt.clicked.connect(self.run_pdf_to_ppt)
-        self.btn_ppt_pdf.clicked.connect(self.run_ppt_to_pdf)
-        
-        # New Tool Connections
-        self.btn_watermark.clicked.connect(self.run_watermark)
-        self.btn_encrypt.clicked.connect(self.run_encrypt)
-        self.btn_decrypt.clicked.connect(self.run_decrypt)
-        self.btn_rotate.clicked.connect(self.run_rotation)
-        self.btn_extract.clicked.connect(self.run_text_extraction)
-        self.btn_metadata.clicked.connect(self.show_metadata)
     
-    def create_tool_card(self, title, description, color, button_text):
-        """Helper to create consistent tool cards."""
-        card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #1A1A1D, stop:1 #161618);
-                border: 1px solid #2A2A2F;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+    def new_card(self, title, description):
+        """Empty tool card with its title and description; returns (card, layout)."""
+        card = CardFrame()
         layout = QVBoxLayout(card)
         
         title_label = QLabel(title)
-        title_label.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
+        title_label.setObjectName("CardTitle")
         layout.addWidget(title_label)
         
         desc_label = QLabel(description)
-        desc_label.setStyleSheet("color: #9CA3AF; font-size: 12px; margin-bottom: 12px;")
+        desc_label.setObjectName("CardDesc")
         layout.addWidget(desc_label)
+        return card, layout
+    
+    def create_tool_card(self, title, description, color, button_text):
+        """Helper to create consistent tool cards."""
+        card, layout = self.new_card(title, description)
         
         button = QPushButton(button_text)
         button.setFixedHeight(44)
-        button.setStyleSheet(f"""
+        button.setStyleSheet(self.card_button_qss(color))
+        layout.addWidget(button)
+        
+        return card
+    
+    # Gradient end colors for the card button accents
+    DARKER = {
+        "#3B82F6": "#2563EB",
+        "#10B981": "#059669",
+        "#F59E0B": "#D97706"
+    }
+
+    @staticmethod
+    def darken_color(color):
+        """Simple color darkening for gradients."""
+        return ToolsWidget.DARKER.get(color, color)
+
+    CARD_BUTTON_QSS = """
             QPushButton {{
                 background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 {color}, stop:1 {self.darken_color(color)});
+                                            stop:0 {color}, stop:1 {darker});
                 color: white;
                 padding: 12px;
                 border-radius: 8px;
@@ -1538,49 +2090,64 @@ class ToolsWidget(QWidget):
             QPushButton:hover {{
                 background: {color};
             }}
-        """)
-        layout.addWidget(button)
-        
-        return card
-    
-    def darken_color(self, color):
-        """Simple color darkening for gradients."""
-        colors = {
-            "#3B82F6": "#2563EB",
-            "#10B981": "#059669",
-            "#F59E0B": "#D97706"
-        }
-        return colors.get(color, color)
+        """
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def card_button_qss(color):
+        """Card button stylesheet for an accent color, built once per color."""
+        return ToolsWidget.CARD_BUTTON_QSS.format(color=color, darker=ToolsWidget.darken_color(color))
 
     def select_file(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select PDF", "", "PDF Files (*.pdf)")
+        path = open_file_dialog(self, "Select PDF")
         return path
 
     def run_compression(self):
         path = self.select_file()
         if path:
-            out, _ = QFileDialog.getSaveFileName(self, "Save Compressed PDF", "", "PDF Files (*.pdf)")
+            out = save_file_dialog(self, "Save Compressed PDF")
             if out:
-                PDFEngine.compress_pdf(path, out)
-                original_size = os.path.getsize(path) / 1024 / 1024
-                compressed_size = os.path.getsize(out) / 1024 / 1024
-                reduction = ((original_size - compressed_size) / original_size) * 100
-                QMessageBox.information(self, "✅ Success", 
-                                      f"PDF compressed successfully!\n\n"
-                                      f"Original: {original_size:.2f} MB\n"
-                                      f"Compressed: {compressed_size:.2f} MB\n"
-                                      f"Reduction: {reduction:.1f}%")
+                # Taken up front: out may overwrite path
+                original_size = os.stat(path).st_size / MB
+                
+                def done(ok, result):
+                    if not ok:
+                        QMessageBox.critical(self, "❌ Error", f"Failed to compress PDF.\n\nError: {result}")
+                        return
+                    compressed_size = os.stat(out).st_size / MB
+                    reduction = (1 - compressed_size / original_size) * 100 if original_size else 0.0
+                    QMessageBox.information(self, "✅ Success", 
+                                          f"PDF compressed successfully!\n\n"
+                                          f"Original: {original_size:.2f} MB\n"
+                                          f"Compressed: {compressed_size:.2f} MB\n"
+                                          f"Reduction: {reduction:.1f}%")
+                
+                run_job(self, self.btn_compress, "Compressing PDF...", done,
+                        PDFEngine.compress_pdf, path, out)
 
     def run_conversion(self):
         path = self.select_file()
-        if path:
-            out_dir = QFileDialog.getExistingDirectory(self, "Select Directory to Save Images")
-            if out_dir:
-                page_count = PDFEngine.get_page_count(path)
-                PDFEngine.pdf_to_images(path, out_dir)
-                QMessageBox.information(self, "✅ Success", 
-                                      f"PDF converted to images!\n\n"
-                                      f"Created {page_count} image files in:\n{out_dir}")
+        if not path:
+            return
+        if self.images_zip.isChecked():
+            output = save_file_dialog(self, "Save Images As", "ZIP Archives (*.zip)")
+            if output and not output.endswith('.zip'): output += '.zip'
+            convert = PDFEngine.pdf_to_images_zip
+        else:
+            output = directory_dialog(self, "Select Directory to Save Images")
+            convert = PDFEngine.pdf_to_images
+        if not output:
+            return
+        
+        def done(ok, result):
+            if not ok:
+                QMessageBox.critical(self, "❌ Error", f"Failed to convert PDF.\n\nError: {result}")
+                return
+            QMessageBox.information(self, "✅ Success", 
+                                  f"PDF converted to images!\n\n"
+                                  f"Created {result} image files in:\n{output}")
+        
+        run_job(self, self.btn_convert, "Converting pages to images...", done, convert, path, output)
 
     def run_remove_pages(self):
         path = self.select_file()
@@ -1598,24 +2165,20 @@ class ToolsWidget(QWidget):
             return
 
         try:
-            pages_to_keep = set()
-            parts = pages_str.split(',')
-            for part in parts:
-                part = part.strip()
-                if '-' in part:
-                    start, end = map(int, part.split('-'))
-                    pages_to_keep.update(range(start-1, end))
-                else:
-                    pages_to_keep.add(int(part) - 1)
+            sorted_pages = parse_page_ranges(pages_str)
             
-            sorted_pages = sorted(list(pages_to_keep))
-            
-            out, _ = QFileDialog.getSaveFileName(self, "Save Extracted Pages", "", "PDF Files (*.pdf)")
+            out = save_file_dialog(self, "Save Extracted Pages")
             if out:
-                PDFEngine.remove_pages(path, sorted_pages, out)
-                QMessageBox.information(self, "✅ Success", 
-                                      f"Successfully extracted {len(sorted_pages)} pages!\n\n"
-                                      f"Saved to:\n{out}")
+                def done(ok, result):
+                    if not ok:
+                        QMessageBox.critical(self, "❌ Error", f"Failed to extract pages.\n\nError: {result}")
+                        return
+                    QMessageBox.information(self, "✅ Success", 
+                                          f"Successfully extracted {result} page{'s' if result != 1 else ''}!\n\n"
+                                          f"Saved to:\n{out}")
+                
+                run_job(self, self.btn_remove, "Extracting pages...", done,
+                        PDFEngine.remove_pages, path, sorted_pages, out)
 
         except ValueError:
             QMessageBox.critical(self, "❌ Invalid Format", 
@@ -1623,102 +2186,42 @@ class ToolsWidget(QWidget):
                                "Please use numbers and dashes.\n"
                                "Examples: 1, 3-5, 7")
 
-    def show_progress(self, message):
-        """Helper to show a simple progress dialog or blocking wait."""
-        # For simplicity, we just change cursor, but a dialog is better.
-        # Let's use QProgressDialog to show we are busy
-        from PySide6.QtWidgets import QProgressDialog
-        progress = QProgressDialog(message, None, 0, 0, self)
-        progress.setWindowTitle("Processing")
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setCancelButton(None)
-        progress.show()
-        QApplication.processEvents()
-        return progress
-
-    def run_pdf_to_word(self):
-        path = self.select_file()
-        if path:
-            out, _ = QFileDialog.getSaveFileName(self, "Save Word Document", "", "Word Documents (*.docx)")
-            if out:
-                if not out.endswith('.docx'): out += '.docx'
-                progress = self.show_progress("Converting PDF to Word...")
-                success = PDFEngine.pdf_to_word(path, out)
-                progress.close()
-                if success:
-                    QMessageBox.information(self, "✅ Success", f"Converted to Word:\n{out}")
-                else:
-                    QMessageBox.critical(self, "❌ Error", "Conversion failed.")
-
-    def run_word_to_pdf(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Word Document", "", "Word Documents (*.docx *.doc)")
-        if path:
-            out, _ = QFileDialog.getSaveFileName(self, "Save PDF", "", "PDF Files (*.pdf)")
-            if out:
-                if not out.endswith('.pdf'): out += '.pdf'
-                progress = self.show_progress("Converting Word to PDF...")
-                success = PDFEngine.word_to_pdf(path, out)
-                progress.close()
-                if success:
-                    QMessageBox.information(self, "✅ Success", f"Converted to PDF:\n{out}")
-                else:
-                    QMessageBox.critical(self, "❌ Error", "Conversion failed.")
-
-    def run_pdf_to_excel(self):
-        path = self.select_file()
-        if path:
-            out, _ = QFileDialog.getSaveFileName(self, "Save Excel Spreadsheet", "", "Excel Files (*.xlsx)")
-            if out:
-                if not out.endswith('.xlsx'): out += '.xlsx'
-                progress = self.show_progress("Converting PDF to Excel...")
-                success = PDFEngine.pdf_to_excel(path, out)
-                progress.close()
-                if success:
-                    QMessageBox.information(self, "✅ Success", f"Converted to Excel:\n{out}")
-                else:
-                    QMessageBox.critical(self, "❌ Error", "Conversion failed. No tables found or error occurred.")
-
-    def run_excel_to_pdf(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Excel File", "", "Excel Files (*.xlsx *.xls)")
-        if path:
-            out, _ = QFileDialog.getSaveFileName(self, "Save PDF", "", "PDF Files (*.pdf)")
-            if out:
-                if not out.endswith('.pdf'): out += '.pdf'
-                progress = self.show_progress("Converting Excel to PDF...")
-                success = PDFEngine.excel_to_pdf(path, out)
-                progress.close()
-                if success:
-                    QMessageBox.information(self, "✅ Success", f"Converted to PDF:\n{out}")
-                else:
-                    QMessageBox.critical(self, "❌ Error", "Conversion failed.")
-
-    def run_pdf_to_ppt(self):
-        path = self.select_file()
-        if path:
-            out, _ = QFileDialog.getSaveFileName(self, "Save PowerPoint", "", "PowerPoint Files (*.pptx)")
-            if out:
-                if not out.endswith('.pptx'): out += '.pptx'
-                progress = self.show_progress("Converting PDF to PowerPoint...")
-                success = PDFEngine.pdf_to_powerpoint(path, out)
-                progress.close()
-                if success:
-                    QMessageBox.information(self, "✅ Success", f"Converted to PowerPoint:\n{out}")
-                else:
-                    QMessageBox.critical(self, "❌ Error", "Conversion failed.")
+    # Office conversions: key -> (input dialog title, input filter, output dialog title,
+    # output filter, output extension, result label, engine call, progress message, failure message)
+    OFFICE_CONVERSIONS = {
+        "pdf_word": (None, None, "Save Word Document", "Word Documents (*.docx)", ".docx", "Word",
+                     PDFEngine.pdf_to_word, "Converting PDF to Word...", "Conversion failed."),
+        "word_pdf": ("Select Word Document", "Word Documents (*.docx *.doc)", "Save PDF", PDF_FILTER, ".pdf", "PDF",
+                     PDFEngine.word_to_pdf, "Converting Word to PDF...", "Conversion failed."),
+        "pdf_excel": (None, None, "Save Excel Spreadsheet", "Excel Files (*.xlsx)", ".xlsx", "Excel",
+                      PDFEngine.pdf_to_excel, "Converting PDF to Excel...",
+                      "Conversion failed. No tables found or error occurred."),
+        "excel_pdf": ("Select Excel File", "Excel Files (*.xlsx *.xls)", "Save PDF", PDF_FILTER, ".pdf", "PDF",
+                      PDFEngine.excel_to_pdf, "Converting Excel to PDF...", "Conversion failed."),
+        "pdf_ppt": (None, None, "Save PowerPoint", "PowerPoint Files (*.pptx)", ".pptx", "PowerPoint",
+                    PDFEngine.pdf_to_powerpoint, "Converting PDF to PowerPoint...", "Conversion failed."),
+        "ppt_pdf": ("Select PowerPoint", "PowerPoint Files (*.pptx *.ppt)", "Save PDF", PDF_FILTER, ".pdf", "PDF",
+                    PDFEngine.powerpoint_to_pdf, "Converting PowerPoint to PDF...", "Conversion failed."),
+    }
 
-    def run_ppt_to_pdf(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select PowerPoint", "", "PowerPoint Files (*.pptx *.ppt)")
-        if path:
-            out, _ = QFileDialog.getSaveFileName(self, "Save PDF", "", "PDF Files (*.pdf)")
-            if out:
-                if not out.endswith('.pdf'): out += '.pdf'
-                progress = self.show_progress("Converting PowerPoint to PDF...")
-                success = PDFEngine.powerpoint_to_pdf(path, out)
-                progress.close()
-                if success:
-                    QMessageBox.information(self, "✅ Success", f"Converted to PDF:\n{out}")
-                else:
-                    QMessageBox.critical(self, "❌ Error", "Conversion failed.")
+    def run_office_conversion(self, key, button):
+        (open_title, open_filter, save_title, save_filter, ext, label,
+         convert, message, failure) = self.OFFICE_CONVERSIONS[key]
+        path = open_file_dialog(self, open_title, open_filter) if open_title else self.select_file()
+        if not path:
+            return
+        out = save_file_dialog(self, save_title, save_filter)
+        if not out:
+            return
+        if not out.endswith(ext): out += ext
+        
+        def done(ok, result):
+            if ok and result:
+                QMessageBox.information(self, "✅ Success", f"Converted to {label}:\n{out}")
+            else:
+                QMessageBox.critical(self, "❌ Error", failure)
+        
+        run_job(self, button, message, done, convert, path, out)
     
     def run_watermark(self):
         """Add watermark to PDF."""
@@ -1730,17 +2233,18 @@ class ToolsWidget(QWidget):
         
         path = self.select_file()
         if path:
-            out, _ = QFileDialog.getSaveFileName(self, "Save Watermarked PDF", "", "PDF Files (*.pdf)")
+            out = save_file_dialog(self, "Save Watermarked PDF")
             if out:
                 if not out.endswith('.pdf'): out += '.pdf'
-                progress = self.show_progress("Adding watermark...")
-                success = PDFEngine.add_watermark(path, watermark_text, out)
-                progress.close()
-                if success:
-                    QMessageBox.information(self, "✅ Success", 
-                                          f"Watermark applied successfully!\n\nSaved to:\n{out}")
-                else:
-                    QMessageBox.critical(self, "❌ Error", "Failed to add watermark.")
+                def done(ok, result):
+                    if ok and result:
+                        QMessageBox.information(self, "✅ Success", 
+                                              f"Watermark applied successfully!\n\nSaved to:\n{out}")
+                    else:
+                        QMessageBox.critical(self, "❌ Error", "Failed to add watermark.")
+                
+                run_job(self, self.btn_watermark, "Adding watermark...", done,
+                        PDFEngine.add_watermark, path, watermark_text, out)
     
     def run_encrypt(self):
         """Encrypt PDF with password."""
@@ -1752,20 +2256,21 @@ class ToolsWidget(QWidget):
         
         path = self.select_file()
         if path:
-            out, _ = QFileDialog.getSaveFileName(self, "Save Encrypted PDF", "", "PDF Files (*.pdf)")
+            out = save_file_dialog(self, "Save Encrypted PDF")
             if out:
                 if not out.endswith('.pdf'): out += '.pdf'
-                progress = self.show_progress("Encrypting PDF...")
-                success = PDFEngine.encrypt_pdf(path, out, password)
-                progress.close()
-                if success:
-                    QMessageBox.information(self, "✅ Success", 
-                                          f"PDF encrypted successfully!\n\n"
-                                          f"Password: {password}\n"
-                                          f"Saved to:\n{out}")
-                    self.encrypt_password.clear()
-                else:
-                    QMessageBox.critical(self, "❌ Error", "Failed to encrypt PDF.")
+                def done(ok, result):
+                    if ok and result:
+                        QMessageBox.information(self, "✅ Success", 
+                                              f"PDF encrypted successfully!\n\n"
+                                              f"Password: {password}\n"
+                                              f"Saved to:\n{out}")
+                        self.encrypt_password.clear()
+                    else:
+                        QMessageBox.critical(self, "❌ Error", "Failed to encrypt PDF.")
+                
+                run_job(self, self.btn_encrypt, "Encrypting PDF...", done,
+                        PDFEngine.encrypt_pdf, path, out, password)
     
     def run_decrypt(self):
         """Decrypt password-protected PDF."""
@@ -1777,23 +2282,24 @@ class ToolsWidget(QWidget):
         
         path = self.select_file()
         if path:
-            out, _ = QFileDialog.getSaveFileName(self, "Save Decrypted PDF", "", "PDF Files (*.pdf)")
+            out = save_file_dialog(self, "Save Decrypted PDF")
             if out:
                 if not out.endswith('.pdf'): out += '.pdf'
-                progress = self.show_progress("Decrypting PDF...")
-                success = PDFEngine.decrypt_pdf(path, out, password)
-                progress.close()
-                if success:
-                    QMessageBox.information(self, "✅ Success", 
-                                          f"PDF decrypted successfully!\n\nSaved to:\n{out}")
-                    self.decrypt_password.clear()
-                else:
-                    QMessageBox.warning(self, "❌ Decryption Failed", 
-                                      "Failed to decrypt PDF.\n\n"
-                                      "Possible reasons:\n"
-                                      "• Incorrect password\n"
-                                      "• File is not encrypted\n"
-                                      "• File is corrupted")
+                def done(ok, result):
+                    if ok and result:
+                        QMessageBox.information(self, "✅ Success", 
+                                              f"PDF decrypted successfully!\n\nSaved to:\n{out}")
+                        self.decrypt_password.clear()
+                    else:
+                        QMessageBox.warning(self, "❌ Decryption Failed", 
+                                          "Failed to decrypt PDF.\n\n"
+                                          "Possible reasons:\n"
+                                          "• Incorrect password\n"
+                                          "• File is not encrypted\n"
+                                          "• File is corrupted")
+                
+                run_job(self, self.btn_decrypt, "Decrypting PDF...", done,
+                        PDFEngine.decrypt_pdf, path, out, password)
     
     def run_rotation(self):
         """Rotate pages in PDF."""
@@ -1801,14 +2307,8 @@ class ToolsWidget(QWidget):
         if not path:
             return
         
-        # Get rotation angle from combo box
-        angle_text = self.rotation_angle.currentText()
-        angle_map = {
-            "90° Clockwise": 90,
-            "180°": 180,
-            "270° Clockwise": 270
-        }
-        rotation = angle_map.get(angle_text, 90)
+        # Get rotation angle from the checked radio button
+        rotation = self.rotation_angle.checkedId()
         
         # Determine which pages to rotate
         pages = None  # None means all pages
@@ -1816,21 +2316,21 @@ class ToolsWidget(QWidget):
             # Could add page selection input here, for now just rotate all
             pages = None
         
-        out, _ = QFileDialog.getSaveFileName(self, "Save Rotated PDF", "", "PDF Files (*.pdf)")
+        out = save_file_dialog(self, "Save Rotated PDF")
         if out:
             if not out.endswith('.pdf'): out += '.pdf'
-            progress = self.show_progress(f"Rotating pages by {rotation}°...")
-            success = PDFEngine.rotate_pages(path, out, rotation, pages)
-            progress.close()
-            if success:
-                page_count = PDFEngine.get_page_count(out)
-                QMessageBox.information(self, "✅ Success", 
-                                      f"Pages rotated successfully!\n\n"
-                                      f"Rotation: {rotation}°\n"
-                                      f"Pages affected: {page_count}\n"
-                                      f"Saved to:\n{out}")
-            else:
-                QMessageBox.critical(self, "❌ Error", "Failed to rotate pages.")
+            def done(ok, result):
+                if ok and result:
+                    QMessageBox.information(self, "✅ Success", 
+                                          f"Pages rotated successfully!\n\n"
+                                          f"Rotation: {rotation}°\n"
+                                          f"Pages affected: {result}\n"
+                                          f"Saved to:\n{out}")
+                else:
+                    QMessageBox.critical(self, "❌ Error", "Failed to rotate pages.")
+            
+            run_job(self, self.btn_rotate, f"Rotating pages by {rotation}°...", done,
+                    PDFEngine.rotate_pages, path, out, rotation, pages)
     
     def run_text_extraction(self):
         """Extract text from PDF to TXT file."""
@@ -1838,34 +2338,25 @@ class ToolsWidget(QWidget):
         if not path:
             return
         
-        out, _ = QFileDialog.getSaveFileName(self, "Save Extracted Text", "", "Text Files (*.txt)")
+        out = save_file_dialog(self, "Save Extracted Text", "Text Files (*.txt)")
         if out:
             if not out.endswith('.txt'): out += '.txt'
-            progress = self.show_progress("Extracting text from PDF...")
             
-            try:
-                # Extract text from all pages
-                text = PDFEngine.extract_text(path)
-                
-                # Write to file
-                with open(out, 'w', encoding='utf-8') as f:
-                    f.write(text)
-                
-                progress.close()
-                
-                # Count words and characters
-                word_count = len(text.split())
-                char_count = len(text)
+            def done(ok, result):
+                if not ok:
+                    QMessageBox.critical(self, "❌ Error", 
+                                       f"Failed to extract text.\n\nError: {result}")
+                    return
+                char_count, word_count = result
                 
                 QMessageBox.information(self, "✅ Success", 
                                       f"Text extracted successfully!\n\n"
                                       f"Characters: {char_count:,}\n"
                                       f"Words: {word_count:,}\n"
                                       f"Saved to:\n{out}")
-            except Exception as e:
-                progress.close()
-                QMessageBox.critical(self, "❌ Error", 
-                                   f"Failed to extract text.\n\nError: {str(e)}")
+            
+            run_job(self, self.btn_extract, "Extracting text from PDF...", done,
+                    PDFEngine.write_text, path, out)
     
     def show_metadata(self):
         """Display PDF metadata in a dialog."""
@@ -1873,13 +2364,15 @@ class ToolsWidget(QWidget):
         if not path:
             return
         
-        try:
-            pdf_info = PDFEngine.get_pdf_info(path)
-            dialog = MetadataDialog(pdf_info, self)
-            dialog.exec()
-        except Exception as e:
-            QMessageBox.critical(self, "❌ Error", 
-                               f"Failed to read PDF metadata.\n\nError: {str(e)}")
+        def done(ok, result):
+            if not ok:
+                QMessageBox.critical(self, "❌ Error", 
+                                   f"Failed to read PDF metadata.\n\nError: {result}")
+                return
+            MetadataDialog(result, self).exec()
+        
+        run_job(self, self.btn_metadata, "Reading PDF information...", done,
+                PDFEngine.get_pdf_info, path)
 
 class PDFMasterApp(QMainWindow):
     def __init__(self):
@@ -1894,7 +2387,6 @@ class PDFMasterApp(QMainWindow):
         # Enable window resizing and set minimum size
         self.setMinimumSize(900, 600)
         self.resize(1280, 820)
-        self.setStyleSheet(STYLESHEET)
         
         # Track fullscreen state
         self.is_fullscreen = False
@@ -1929,23 +2421,29 @@ class PDFMasterApp(QMainWindow):
         self.init_view_page()
         self.workspace.addWidget(self.view_page)
         
+        # The other pages are empty containers, filled on first visit
         self.merge_page = QWidget()
-        self.init_merge_page()
         self.workspace.addWidget(self.merge_page)
 
         self.split_page = QWidget()
-        self.init_split_page()
         self.workspace.addWidget(self.split_page)
         
-        self.tools_page = ToolsWidget()
+        self.tools_page = QWidget()
         self.workspace.addWidget(self.tools_page)
         
+        self._page_builders = {
+            1: self.init_merge_page,
+            2: self.init_split_page,
+            3: self.init_tools_page,
+        }
+        
         # Connections
         self.sidebar.btn_view.clicked.connect(lambda: self.switch_page(0))
         self.sidebar.btn_merge.clicked.connect(lambda: self.switch_page(1))
         self.sidebar.btn_split.clicked.connect(lambda: self.switch_page(2))
         self.sidebar.btn_tools.clicked.connect(lambda: self.switch_page(3))
         self.sidebar.btn_help.clicked.connect(self.show_help)
+        self.sidebar.btn_clear_cache.clicked.connect(self.clear_cache)
         
         # Keyboard shortcuts
         self.setup_shortcuts()
@@ -2018,24 +2516,9 @@ class PDFMasterApp(QMainWindow):
         subtitle.setStyleSheet("color: #6B7280; font-size: 13px; margin-bottom: 24px;")
         welcome_layout.addWidget(subtitle)
         
-        self.btn_open = QPushButton("📂 Open PDF File")
+        self.btn_open = icon_button("📂", "Open PDF File")
         self.btn_open.setFixedSize(180, 50)
-        self.btn_open.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #3B82F6, stop:1 #2563EB);
-                color: white;
-                padding: 14px 28px;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 14px;
-                border: none;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #60A5FA, stop:1 #3B82F6);
-            }
-        """)
+        self.btn_open.setObjectName("PrimaryBtn")
         self.btn_open.clicked.connect(self.open_pdf)
         welcome_layout.addWidget(self.btn_open, 0, Qt.AlignCenter)
         
@@ -2044,35 +2527,23 @@ class PDFMasterApp(QMainWindow):
         if recent_files:
             welcome_layout.addSpacing(32)
             recent_label = QLabel("Recent Files")
-            recent_label.setStyleSheet("color: #9CA3AF; font-size: 14px; font-weight: bold;")
+            recent_label.setObjectName("RecentLabel")
             recent_label.setAlignment(Qt.AlignCenter)
             welcome_layout.addWidget(recent_label)
             
             self.recent_list = QListWidget()
             self.recent_list.setMaximumHeight(150)
-            self.recent_list.setStyleSheet("""
-                QListWidget {
-                    background-color: transparent;
-                    border: none;
-                    color: #60A5FA;
-                    font-size: 12px;
-                }
-                QListWidget::item {
-                    padding: 6px;
-                }
-                QListWidget::item:hover {
-                    background-color: #27272A;
-                    border-radius: 4px;
-                }
-            """)
+            self.recent_list.setObjectName("RecentList")
             for file in recent_files[:5]:
                 self.recent_list.addItem(f"📄 {os.path.basename(file)}")
             self.recent_list.itemClicked.connect(self.open_recent_file)
             welcome_layout.addWidget(self.recent_list)
         
-        layout.addWidget(self.welcome_widget)
-        layout.addWidget(self.pdf_viewer)
-        self.pdf_viewer.hide()
+        # Welcome (0) and viewer (1) share one slot; switching needs no relayout
+        self.view_stack = QStackedWidget()
+        self.view_stack.addWidget(self.welcome_widget)
+        self.view_stack.addWidget(self.pdf_viewer)
+        layout.addWidget(self.view_stack)
 
     def init_merge_page(self):
         layout = QVBoxLayout(self.merge_page)
@@ -2086,8 +2557,19 @@ class PDFMasterApp(QMainWindow):
         self.split_widget = SplitWidget()
         layout.addWidget(self.split_widget)
 
+    def init_tools_page(self):
+        layout = QVBoxLayout(self.tools_page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.tools_widget = ToolsWidget()
+        layout.addWidget(self.tools_widget)
+
     def switch_page(self, index):
         """Switch workspace page with smooth transition."""
+        # Build the page on first visit
+        builder = self._page_builders.pop(index, None)
+        if builder:
+            builder()
+        
         # Update workspace
         old_index = self.workspace.currentIndex()
         self.workspace.setCurrentIndex(index)
@@ -2108,11 +2590,10 @@ class PDFMasterApp(QMainWindow):
         self.status_bar.showMessage(status_messages[index])
 
     def open_pdf(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "Open PDF", "", "PDF Files (*.pdf)")
+        file_path = open_file_dialog(self, "Open PDF")
         if file_path:
             self.recent_files.add_file(file_path)
-            self.welcome_widget.hide()
-            self.pdf_viewer.show()
+            self.view_stack.setCurrentIndex(1)
             self.pdf_viewer.load_pdf(file_path)
             self.status_bar.showMessage(f"Opened: {os.path.basename(file_path)}")
     
@@ -2123,8 +2604,7 @@ class PDFMasterApp(QMainWindow):
         if index < len(recent_files):
             file_path = recent_files[index]
             if os.path.exists(file_path):
-                self.welcome_widget.hide()
-                self.pdf_viewer.show()
+                self.view_stack.setCurrentIndex(1)
                 self.pdf_viewer.load_pdf(file_path)
                 self.status_bar.showMessage(f"Opened: {os.path.basename(file_path)}")
 
@@ -2133,13 +2613,23 @@ class PDFMasterApp(QMainWindow):
         dialog = HelpDialog(self)
         dialog.exec()
 
+    def clear_cache(self):
+        """Delete results PDFEngine keeps for files it has already processed."""
+        freed = PDFEngine.clear_cache()
+        self.status_bar.showMessage(f"Cleared {freed / MB:.1f} MB of cached results")
+
 if __name__ == "__main__":
+    # Needed for ProcessPoolExecutor workers in the PyInstaller build
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     
     # Set application-wide font
     font = QFont("Segoe UI", 10)
     app.setFont(font)
     
+    # Parsed once for the whole app, before any widget is polished
+    app.setStyleSheet(STYLESHEET)
+    
     window = PDFMasterApp()
     window.show()
     sys.exit(app.exec())
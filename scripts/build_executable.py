@@ -32,10 +32,18 @@ def build():
         "pyinstaller",
         "--noconfirm",
         "--clean",
-        "--onefile",
+        # A folder build starts straight away; --onefile unpacks itself to a
+        # temp directory on every launch
+        "--onedir",
+        "--contents-directory", "_internal",
         "--windowed",
+        "--exclude-module", "tkinter",
+        "--exclude-module", "unittest",
+        "--exclude-module", "pydoc_data",
         "--name", app_name,
         "--add-data", f"{icon_name}{sep}.",
+        # fitz is imported lazily, which PyInstaller's import scan can't see
+        "--hidden-import", "fitz",
         # Add any other resources here, e.g. config.json if you want a default one
         # "--add-data", f"config.json{sep}.", 
     ]
@@ -58,7 +66,7 @@ def build():
     try:
         subprocess.check_call(cmd)
         print("\nBuild completed successfully!")
-        print(f"Executable can be found in the 'dist' folder: {os.path.join(base_dir, 'dist')}")
+        print(f"Application folder can be found in: {os.path.join(base_dir, 'dist', app_name)}")
     except subprocess.CalledProcessError as e:
         print(f"\nBuild failed with error code {e.returncode}")
     except FileNotFoundError:
@@ -1,78 +1,578 @@
-import fitz  # PyMuPDF
-from pypdf import PdfReader, PdfWriter
+import atexit
+import importlib.util
 import os
+import sys
 import subprocess
-from pdf2docx import Converter
-import pandas as pd
-import pdfplumber
-from pptx import Presentation
-from pptx.util import Inches
+import tempfile
 import io
+import hashlib
+import shutil
+import threading
+import time
+import zipfile
+from collections import OrderedDict, deque
+from functools import lru_cache, wraps
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+def _lazy_import(name):
+    """Returns module name, deferring its execution until an attribute is first used."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# PyMuPDF and its shared libraries load on the first PDF operation, not at startup
+fitz = _lazy_import("fitz")
+
+# MuPDF must not be used from two threads at once. Every in-process fitz call
+# holds this lock for its duration; office, pdfplumber and worker-process work
+# run outside it.
+_fitz_lock = threading.RLock()
+
+def _serialized(fn):
+    """Runs fn while holding _fitz_lock."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with _fitz_lock:
+            return fn(*args, **kwargs)
+    return wrapper
+
+# Image colorspaces that can be displayed as 8-bit grayscale
+GRAY_COLORSPACES = ("DeviceGray", "CalGray")
+
+# Qt maps PNG quality 80 to zlib level 1; MuPDF's own writer uses level 6
+PNG_QUALITY = 80
+JPEG_QUALITY = 85
+
+# MuPDF's object store is trimmed once it grows past this many bytes
+STORE_LIMIT = 256 << 20
+
+# Below this many pages, worker process start-up costs more than it saves
+PARALLEL_MIN_PAGES = 32
+
+# Serialized pages a split worker may queue for writing before it waits on the disk
+MAX_PENDING_WRITES = 8
+
+# Table detection costs far more per page than rendering, so it parallelises sooner
+TABLE_PARALLEL_MIN_PAGES = 8
+
+# Results of slow operations, stored under the BLAKE2b digest of their input
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pdf-manager")
+
+# Least recently used entries are pruned past this total size or age
+CACHE_MAX_BYTES = 512 << 20
+CACHE_MAX_AGE = 30 * 24 * 3600
+
+@lru_cache(maxsize=256)
+def _fingerprint(path, size, mtime_ns):
+    """BLAKE2b digest of path's contents; size and mtime in the key invalidate edits."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def _cache_file(path, suffix):
+    """Cache location for a result derived from path's contents, or None if caching is off."""
+    if not PDFEngine.CACHE_ENABLED:
+        return None
+    return os.path.join(CACHE_DIR, f"{PDFEngine.fingerprint(path)}.{suffix}")
+
+def _cache_get(cache_path):
+    """True if cache_path holds a result, marking it recently used."""
+    try:
+        os.utime(cache_path)
+        return True
+    except OSError:
+        return False
+
+def _cache_put(cache_path, fill):
+    """Stores a result by calling fill(tmp_path), then renaming into place.
+    
+    The cache is best effort; a failure here never fails the operation.
+    """
+    tmp = cache_path + ".tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fill(tmp)
+        os.replace(tmp, cache_path)
+        _cache_prune()
+    except OSError:
+        pass
+
+def _cache_prune():
+    """Deletes entries unused for CACHE_MAX_AGE, then the least recently used
+    until the cache fits in CACHE_MAX_BYTES."""
+    entries = []
+    with os.scandir(CACHE_DIR) as it:
+        for entry in it:
+            if entry.is_file():
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    expired = time.time() - CACHE_MAX_AGE
+    for mtime, size, path in entries:
+        if mtime >= expired and total <= CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+def _init_worker():
+    """Pool initializer: keep MuPDF's per-page warnings out of the workers' stderr."""
+    fitz.TOOLS.mupdf_display_errors(False)
+
+def _write_file(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+@_serialized
+def _split_range(path, output_dir, base_name, start, stop):
+    """Worker: writes pages start..stop-1 of path as single-page PDFs.
+    
+    Pages are serialized here and written by a few threads, so file I/O
+    overlaps with building the next page. At most MAX_PENDING_WRITES pages
+    wait in memory; past that, the oldest write is waited for first.
+    """
+    src = fitz.open(path)
+    with ThreadPoolExecutor(max_workers=4) as writers:
+        pending = deque()
+        for i in range(start, stop):
+            if len(pending) >= MAX_PENDING_WRITES:
+                pending.popleft().result()
+            single = fitz.open()
+            single.insert_pdf(src, from_page=i, to_page=i)
+            out = os.path.join(output_dir, f"{base_name}_page_{i+1}.pdf")
+            pending.append(writers.submit(_write_file, out, single.tobytes()))
+            single.close()
+        for future in pending:
+            future.result()
+    src.close()
+
+@_serialized
+def _images_range(path, output_dir, base_name, fmt, start, stop):
+    """Worker: renders pages start..stop-1 of path to image files."""
+    doc = fitz.open(path)
+    mat = _matrix(2)
+    for i in range(start, stop):
+        # alpha=False gives RGB straight from MuPDF, no colorspace pass
+        pix = doc.load_page(i).get_pixmap(matrix=mat, alpha=False)
+        _write_image(pix, os.path.join(output_dir, f"{base_name}_{i+1}.{fmt}"), fmt)
+    doc.close()
+
+@_serialized
+def _png_range(path, start, stop):
+    """Worker: returns pages start..stop-1 of path rendered at 2x as PNG bytes."""
+    doc = fitz.open(path)
+    mat = _matrix(2)
+    pngs = [_encode_image(doc.load_page(i).get_pixmap(matrix=mat, alpha=False), "png")
+            for i in range(start, stop)]
+    doc.close()
+    return pngs
+
+def _render_pngs(path, count):
+    """PNG bytes for every page, in order, spread over processes for large files."""
+    workers = min(os.cpu_count() or 1, count)
+    if count < PARALLEL_MIN_PAGES or workers < 2:
+        return _png_range(path, 0, count)
+    chunk = -(-count // workers)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(_png_range, path, start, min(start + chunk, count))
+                   for start in range(0, count, chunk)]
+        return [png for future in futures for png in future.result()]
+
+def _tables_range(path, start, stop):
+    """Tables found on pages [start, stop), in page order."""
+    import pdfplumber
+    with pdfplumber.open(path) as pdf:
+        return [table for page in pdf.pages[start:stop] for table in page.extract_tables()]
+
+def _extract_tables(path):
+    """Every table in the PDF, in order, spread over processes for longer files."""
+    import pdfplumber
+    with pdfplumber.open(path) as pdf:
+        count = len(pdf.pages)
+    workers = min(os.cpu_count() or 1, 8, count)
+    if count < TABLE_PARALLEL_MIN_PAGES or workers < 2:
+        return _tables_range(path, 0, count)
+    chunk = -(-count // workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_tables_range, path, start, min(start + chunk, count))
+                   for start in range(0, count, chunk)]
+        return [table for future in futures for table in future.result()]
+
+def _qt_can_encode():
+    """True if this process has a Qt application, without which Qt can't find
+    its image format plugins; worker processes never do and use MuPDF."""
+    qtcore = sys.modules.get("PySide6.QtCore")
+    return qtcore is not None and qtcore.QCoreApplication.instance() is not None
+
+def _image_writer(fmt):
+    """QImageWriter for fmt, using fast deflate for PNG."""
+    from PySide6.QtGui import QImageWriter
+    writer = QImageWriter()
+    writer.setFormat(b"jpeg" if fmt in ("jpg", "jpeg") else b"png")
+    writer.setQuality(JPEG_QUALITY if fmt in ("jpg", "jpeg") else PNG_QUALITY)
+    return writer
+
+def _qimage(pix):
+    from PySide6.QtGui import QImage
+    return QImage(pix.samples_mv, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
+
+def _write_image(pix, out_path, fmt):
+    """Encodes an RGB pixmap to out_path, with Qt where it is available."""
+    if _qt_can_encode():
+        writer = _image_writer(fmt)
+        writer.setFileName(out_path)
+        if writer.write(_qimage(pix)):
+            return
+    # MuPDF's encoder: in worker processes, or if Qt lacks the format plugin
+    pix.save(out_path, jpg_quality=JPEG_QUALITY)
+
+def _encode_image(pix, fmt):
+    """Encodes an RGB pixmap to bytes, with Qt where it is available."""
+    if _qt_can_encode():
+        from PySide6.QtCore import QBuffer, QIODevice
+        buffer = QBuffer()
+        buffer.open(QIODevice.WriteOnly)
+        writer = _image_writer(fmt)
+        writer.setDevice(buffer)
+        if writer.write(_qimage(pix)):
+            return buffer.data().data()
+    return pix.tobytes(fmt, jpg_quality=JPEG_QUALITY)
+
+@lru_cache(maxsize=16)
+def _matrix(zoom):
+    """Shared scaling matrix for zoom; callers must not modify it."""
+    return fitz.Matrix(zoom, zoom)
+
+@lru_cache(maxsize=None)
+def _helv_font():
+    """Shared Helvetica font object, loaded once per process."""
+    return fitz.Font("helv")
+
+@lru_cache(maxsize=64)
+@_serialized
+def _page_count(path, size, mtime_ns):
+    """Cached page count; size and mtime in the key invalidate replaced files."""
+    # Short-lived handle: the shared pool is for the viewer, and an open
+    # handle would stop the file being replaced or deleted on Windows
+    with fitz.open(path) as doc:
+        return doc.page_count
+
+@lru_cache(maxsize=64)
+@_serialized
+def _pdf_info(path, size, mtime_ns):
+    """Metadata for get_pdf_info; size and mtime in the key invalidate replaced files."""
+    with fitz.open(path) as doc:
+        return {
+            'pages': len(doc),
+            'title': doc.metadata.get('title', 'N/A'),
+            'author': doc.metadata.get('author', 'N/A'),
+            'subject': doc.metadata.get('subject', 'N/A'),
+            'creator': doc.metadata.get('creator', 'N/A'),
+            'producer': doc.metadata.get('producer', 'N/A'),
+            'creation_date': doc.metadata.get('creationDate', 'N/A'),
+            'modification_date': doc.metadata.get('modDate', 'N/A'),
+            'encrypted': doc.is_encrypted
+        }
+
+_soffice = None
+_soffice_pipe = None
+_soffice_profile = None
+_soffice_lock = threading.Lock()
+
+def _stop_soffice():
+    if _soffice is not None and _soffice.poll() is None:
+        _soffice.terminate()
+        try:
+            _soffice.wait(5)
+        except subprocess.TimeoutExpired:
+            _soffice.kill()
+    if _soffice_profile is not None:
+        shutil.rmtree(_soffice_profile, ignore_errors=True)
+
+atexit.register(_stop_soffice)
+
+def _uno_desktop():
+    """Desktop of the shared soffice, started on first use; None without python-uno.
+
+    Must be called with _soffice_lock held.
+    """
+    global _soffice, _soffice_pipe, _soffice_profile
+    try:
+        import uno
+    except ImportError:
+        return None
+    local = uno.getComponentContext()
+    resolver = local.ServiceManager.createInstanceWithContext(
+        "com.sun.star.bridge.UnoUrlResolver", local)
+    if _soffice is None or _soffice.poll() is not None:
+        # A pipe name and profile unique to this process: we only ever talk to
+        # the soffice we started, never one belonging to another app or
+        # another instance of this one
+        _soffice_pipe = f"pdf-manager-{os.getpid()}-{os.urandom(4).hex()}"
+        if _soffice_profile is None:
+            _soffice_profile = tempfile.mkdtemp(prefix="pdf-manager-soffice-")
+        _soffice = subprocess.Popen([
+            'soffice', '--headless', '--invisible', '--nologo', '--norestore',
+            f'-env:UserInstallation={uno.systemPathToFileUrl(_soffice_profile)}',
+            f'--accept=pipe,name={_soffice_pipe};urp;'
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"uno:pipe,name={_soffice_pipe};urp;StarOffice.ComponentContext"
+    # A cold start takes a few seconds before the pipe accepts connections
+    for _ in range(100):
+        try:
+            ctx = resolver.resolve(url)
+            break
+        except Exception:
+            if _soffice.poll() is not None:
+                return None
+            time.sleep(0.1)
+    else:
+        return None
+    return ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+
+def _uno_convert(path, output_path, filter_name):
+    """Converts path to PDF through the shared soffice; False if UNO is unavailable."""
+    with _soffice_lock:
+        desktop = _uno_desktop()
+        if desktop is None:
+            return False
+        import uno
+        from com.sun.star.beans import PropertyValue
+
+        def props(**values):
+            return tuple(PropertyValue(Name=k, Value=v) for k, v in values.items())
+
+        doc = desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(path)), "_blank", 0, props(Hidden=True))
+        try:
+            doc.storeToURL(uno.systemPathToFileUrl(os.path.abspath(output_path)),
+                           props(FilterName=filter_name))
+        finally:
+            doc.close(True)
+    return True
 
 class PDFEngine:
-    """Core engine for PDF manipulations using PyMuPDF and pypdf."""
+    """Core engine for PDF manipulations using PyMuPDF."""
+    
+    # Open documents kept around for the viewer's repeated page access, as
+    # path -> (doc, (size, mtime_ns) when opened, {page_num: is grayscale});
+    # guarded by _fitz_lock like every other MuPDF object
+    _doc_cache = OrderedDict()
+    _doc_cache_size = 4
+    
+    # Reuse compression results for inputs already processed (see CACHE_DIR)
+    CACHE_ENABLED = True
+    
+    @classmethod
+    def get_doc(cls, path):
+        """Returns a cached open document for path, opening it on first use.
+        
+        A file replaced on disk since it was opened (new size or mtime) is reopened.
+        """
+        st = os.stat(path)
+        version = (st.st_size, st.st_mtime_ns)
+        with _fitz_lock:
+            cached = cls._doc_cache.get(path)
+            if cached is not None:
+                doc, opened_version, _ = cached
+                if opened_version == version and not doc.is_closed:
+                    cls._doc_cache.move_to_end(path)
+                    return doc
+                del cls._doc_cache[path]
+                doc.close()
+            doc = fitz.open(path)
+            cls._doc_cache[path] = (doc, version, {})
+            if len(cls._doc_cache) > cls._doc_cache_size:
+                _, (oldest, _, _) = cls._doc_cache.popitem(last=False)
+                oldest.close()
+            return doc
+    
+    @classmethod
+    def close_doc(cls, path):
+        """Closes and forgets the cached document for path, if any."""
+        with _fitz_lock:
+            cached = cls._doc_cache.pop(path, None)
+            if cached is not None:
+                cached[0].close()
     
     @staticmethod
+    @_serialized
     def merge_pdfs(paths, output_path):
-        writer = PdfWriter()
+        """Merges PDFs in order, de-duplicating shared objects on save."""
+        merged = fitz.open()
         for path in paths:
-            reader = PdfReader(path)
-            for page in reader.pages:
-                writer.add_page(page)
+            with fitz.open(path) as src:
+                merged.insert_pdf(src)
         
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        merged.save(output_path, garbage=3, deflate=True, clean=True)
+        merged.close()
         return True
 
+    @staticmethod
+    def fingerprint(path):
+        """Content digest of path, only re-read when its size or mtime changes."""
+        st = os.stat(path)
+        return _fingerprint(path, st.st_size, st.st_mtime_ns)
+
+    @staticmethod
+    def clear_cache():
+        """Deletes every stored result; returns the number of bytes freed."""
+        freed = 0
+        try:
+            with os.scandir(CACHE_DIR) as it:
+                for entry in it:
+                    if entry.is_file():
+                        size = entry.stat().st_size
+                        os.remove(entry.path)
+                        freed += size
+        except FileNotFoundError:
+            pass
+        return freed
+
     @staticmethod
     def get_page_count(path):
-        doc = fitz.open(path)
-        count = doc.page_count
-        doc.close()
-        return count
+        st = os.stat(path)
+        return _page_count(path, st.st_size, st.st_mtime_ns)
 
     @staticmethod
-    def render_page(path, page_num, zoom=2.0):
-        doc = fitz.open(path)
-        page = doc.load_page(page_num)
-        mat = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=mat)
+    def render_page(path, page_num, zoom=1.0, clip=None):
+        """Renders a page, or the clip rectangle of it in page points, to an RGB fitz.Pixmap.
+
+        zoom is in device pixels per point, so callers fold in the screen's
+        device pixel ratio. Callers can wrap ``pix.samples_mv`` in a QImage
+        without copying, as long as they keep the pixmap alive while the
+        image is in use.
+        """
+        with _fitz_lock:
+            doc = PDFEngine.get_doc(path)
+            page = doc.load_page(page_num)
+            mat = _matrix(zoom)
+            # Gray scans render to one byte per pixel instead of three; the
+            # verdict lives with the open document, so zooming doesn't redo it
+            gray_pages = PDFEngine._doc_cache[path][2]
+            gray = gray_pages.get(page_num)
+            if gray is None:
+                gray = gray_pages[page_num] = PDFEngine.is_grayscale_page(page)
+            colorspace = fitz.csGRAY if gray else fitz.csRGB
+            return page.get_pixmap(matrix=mat, colorspace=colorspace, alpha=False,
+                                   clip=fitz.Rect(clip) if clip is not None else None)
+
+    @staticmethod
+    def trim_store():
+        """Drops a fifth of MuPDF's cached objects if the store is over STORE_LIMIT."""
+        with _fitz_lock:
+            if fitz.TOOLS.store_size > STORE_LIMIT:
+                fitz.TOOLS.store_shrink(20)
+
+    @staticmethod
+    def is_grayscale_page(page):
+        """Heuristic for scanned pages: only gray images, no drawings, no colored text.
         
-        # Convert to bytes for Qt
-        img_data = pix.tobytes("ppm")
-        doc.close()
-        return img_data
+        Annotations and form widgets are drawn on top and may be colored, so
+        pages with any are never treated as gray.
+        """
+        if page.first_annot or page.first_widget:
+            return False
+        images = page.get_images(full=True)
+        if not images or any(img[5] not in GRAY_COLORSPACES for img in images):
+            return False
+        if page.get_drawings():
+            return False
+        for block in page.get_text("dict")["blocks"]:
+            for line in block.get("lines", []):
+                for span in line["spans"]:
+                    color = span["color"]
+                    r, g, b = color >> 16 & 0xFF, color >> 8 & 0xFF, color & 0xFF
+                    if not r == g == b:
+                        return False
+        return True
+
+    @staticmethod
+    @_serialized
+    def get_thumbnail(path, zoom=0.2):
+        """Returns the page count and a small RGB render of the first page."""
+        with fitz.open(path) as doc:
+            count = doc.page_count
+            pix = doc.load_page(0).get_pixmap(matrix=_matrix(zoom), alpha=False)
+        return count, pix.samples, pix.width, pix.height, pix.stride
 
     @staticmethod
     def split_pdf(path, output_dir):
-        """Splits a PDF into individual pages."""
-        reader = PdfReader(path)
+        """Splits a PDF into individual pages, spreading large files over processes.
+        
+        Returns the number of pages written.
+        """
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
             
         base_name = os.path.splitext(os.path.basename(path))[0]
-        for i, page in enumerate(reader.pages):
-            writer = PdfWriter()
-            writer.add_page(page)
-            output_path = os.path.join(output_dir, f"{base_name}_page_{i+1}.pdf")
-            with open(output_path, "wb") as f:
-                writer.write(f)
-        return True
+        count = PDFEngine.get_page_count(path)
+        workers = min(os.cpu_count() or 1, count)
+        if count < PARALLEL_MIN_PAGES or workers < 2:
+            _split_range(path, output_dir, base_name, 0, count)
+            return count
+        
+        # One contiguous page range per worker so each opens the source once
+        chunk = -(-count // workers)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures = [
+                executor.submit(_split_range, path, output_dir, base_name,
+                                start, min(start + chunk, count))
+                for start in range(0, count, chunk)
+            ]
+            for future in futures:
+                future.result()
+        return count
+
+    @staticmethod
+    @_serialized
+    def split_pdf_to_zip(path, zip_path):
+        """Splits a PDF into single-page PDFs written into one zip archive.
+        
+        Entries are stored uncompressed since PDF streams are already deflated.
+        Returns the number of pages written.
+        """
+        base_name = os.path.splitext(os.path.basename(path))[0]
+        with fitz.open(path) as src, zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as zf:
+            for i in range(src.page_count):
+                with fitz.open() as single:
+                    single.insert_pdf(src, from_page=i, to_page=i)
+                    zf.writestr(f"{base_name}_page_{i+1}.pdf", single.tobytes())
+            return src.page_count
 
     @staticmethod
+    @_serialized
     def remove_pages(path, pages_to_keep, output_path):
-        """Removes pages from a PDF by keeping only specified indices."""
-        reader = PdfReader(path)
-        writer = PdfWriter()
-        for i in pages_to_keep:
-            if i < len(reader.pages):
-                writer.add_page(reader.pages[i])
+        """Removes pages from a PDF by keeping only specified indices.
         
-        with open(output_path, "wb") as f:
-            writer.write(f)
-        return True
+        Indices past the end of the document are skipped. Returns the number
+        of pages kept.
+        """
+        with fitz.open(path) as doc:
+            count = doc.page_count
+            keep = [i for i in pages_to_keep if 0 <= i < count]
+            if not keep:
+                raise ValueError("no requested pages exist in this document")
+            # select() only rewrites the page tree; page contents are left alone
+            doc.select(keep)
+            doc.save(output_path, garbage=3, deflate=True)
+        return len(keep)
 
     @staticmethod
+    @_serialized
     def add_text_annotation(path, page_num, text, x, y, output_path):
         """Adds a text annotation to a specific page."""
         doc = fitz.open(path)
@@ -83,52 +583,106 @@ class PDFEngine:
         return True
 
     @staticmethod
+    @_serialized
     def compress_pdf(path, output_path):
-        """Simple compression by re-saving with optimization."""
+        """Simple compression by re-saving with optimization.
+        
+        Compressing the same contents again copies the cached result.
+        """
+        # Hashed before saving, since output_path may replace path
+        cached = _cache_file(path, "compressed.pdf")
+        if cached and _cache_get(cached):
+            shutil.copyfile(cached, output_path)
+            return True
         doc = fitz.open(path)
-        doc.save(output_path, garbage=4, deflate=True)
+        # Never keep a copy of a password-protected document around
+        if doc.metadata.get("encryption"):
+            cached = None
+        # garbage=4 (duplicate-object merging) is the slow part; skip it when
+        # the streams are already compressed and there is little left to gain
+        garbage = 1 if PDFEngine.is_compressed(doc) else 4
+        doc.save(output_path, garbage=garbage, deflate=True)
         doc.close()
+        if cached:
+            _cache_put(cached, lambda tmp: shutil.copyfile(output_path, tmp))
         return True
 
+    @staticmethod
+    def is_compressed(doc, threshold=0.95):
+        """True if at least threshold of the document's streams already carry a filter."""
+        streams = filtered = 0
+        for xref in range(1, doc.xref_length()):
+            if doc.xref_is_stream(xref):
+                streams += 1
+                if doc.xref_get_key(xref, "Filter")[0] != "null":
+                    filtered += 1
+        return streams > 0 and filtered >= threshold * streams
+
     @staticmethod
     def pdf_to_images(path, output_dir, fmt="png"):
-        """Converts all PDF pages to image files."""
-        doc = fitz.open(path)
+        """Converts all PDF pages to image files, spreading large files over processes.
+        
+        Returns the number of images written.
+        """
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
             
         base_name = os.path.splitext(os.path.basename(path))[0]
-        for i in range(len(doc)):
-            page = doc.load_page(i)
-            pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))
-            pix.save(os.path.join(output_dir, f"{base_name}_{i+1}.{fmt}"))
-        doc.close()
-        return True
+        count = PDFEngine.get_page_count(path)
+        workers = min(os.cpu_count() or 1, count)
+        if count < PARALLEL_MIN_PAGES or workers < 2:
+            _images_range(path, output_dir, base_name, fmt, 0, count)
+            return count
+        
+        chunk = -(-count // workers)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures = [
+                executor.submit(_images_range, path, output_dir, base_name, fmt,
+                                start, min(start + chunk, count))
+                for start in range(0, count, chunk)
+            ]
+            for future in futures:
+                future.result()
+        return count
     
     @staticmethod
+    @_serialized
+    def pdf_to_images_zip(path, zip_path, fmt="png"):
+        """Converts all PDF pages to images written into one uncompressed zip archive.
+        
+        Returns the number of images written.
+        """
+        base_name = os.path.splitext(os.path.basename(path))[0]
+        mat = _matrix(2)
+        with fitz.open(path) as doc, zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as zf:
+            for i in range(doc.page_count):
+                pix = doc.load_page(i).get_pixmap(matrix=mat, alpha=False)
+                zf.writestr(f"{base_name}_{i+1}.{fmt}", _encode_image(pix, fmt))
+            return doc.page_count
+    
+    @staticmethod
+    @_serialized
     def add_watermark(path, watermark_text, output_path, opacity=0.3):
         """Adds a watermark to all pages of a PDF."""
         doc = fitz.open(path)
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
+        # Font and text width are the same on every page
+        fontsize = 60
+        font = _helv_font()
+        text_length = font.text_length(watermark_text, fontsize=fontsize)
+        # The laid-out text only depends on page size, so build one writer per
+        # size (usually just one) and replay it on every page that shares it
+        writers = {}
+        for page in doc:
             rect = page.rect
-            
-            # Calculate center position
-            x = rect.width / 2
-            y = rect.height / 2
-            
-            # Use insert_text directly with a simple approach
-            # Create text at center of page
-            fontsize = 60
-            font = fitz.Font("helv")
-            text_length = font.text_length(watermark_text, fontsize=fontsize)
-            
-            # Position text at center
-            text_point = fitz.Point(x - text_length/2, y)
+            tw = writers.get((rect.width, rect.height))
+            if tw is None:
+                # Position text at center
+                text_point = fitz.Point(rect.width / 2 - text_length / 2, rect.height / 2)
+                tw = fitz.TextWriter(rect)
+                tw.append(text_point, watermark_text, font=font, fontsize=fontsize)
+                writers[(rect.width, rect.height)] = tw
             
             # Insert the text directly on the page with transparency
-            tw = fitz.TextWriter(rect)
-            tw.append(text_point, watermark_text, font=font, fontsize=fontsize)
             tw.write_text(page, color=(0.7, 0.7, 0.7), opacity=opacity)
         
         doc.save(output_path)
@@ -136,6 +690,7 @@ class PDFEngine:
         return True
     
     @staticmethod
+    @_serialized
     def encrypt_pdf(path, output_path, user_password, owner_password=None):
         """Encrypts a PDF with password protection."""
         doc = fitz.open(path)
@@ -156,71 +711,103 @@ class PDFEngine:
         return True
     
     @staticmethod
+    @_serialized
     def decrypt_pdf(path, output_path, password):
         """Removes password protection from a PDF."""
         try:
-            doc = fitz.open(path)
-            if doc.is_encrypted:
-                if not doc.authenticate(password):
+            with fitz.open(path) as doc:
+                if doc.needs_pass and not doc.authenticate(password):
                     return False
-            doc.save(output_path, encryption=fitz.PDF_ENCRYPT_NONE)
-            doc.close()
+                doc.save(output_path, encryption=fitz.PDF_ENCRYPT_NONE)
             return True
-        except:
+        except Exception:
             return False
     
     @staticmethod
+    @_serialized
     def extract_text(path, page_num=None):
         """Extracts text from a PDF page or entire document."""
-        doc = fitz.open(path)
         if page_num is not None:
-            page = doc.load_page(page_num)
-            text = page.get_text()
-        else:
-            text = ""
+            with fitz.open(path) as doc:
+                return doc.load_page(page_num).get_text()
+        # Join once rather than growing one string page by page
+        return "".join(PDFEngine._iter_text(path))
+    
+    @staticmethod
+    def _iter_text(path):
+        """Yields the text of each page in turn from a private handle.
+        
+        Only consumed in full by extract_text and write_text, which hold
+        _fitz_lock throughout. There is deliberately no per-path session
+        shared with the viewer: repeat info reads come from _pdf_info's cache
+        instead, and a long-lived handle would keep the file open.
+        """
+        with fitz.open(path) as doc:
             for page in doc:
-                text += page.get_text()
-        doc.close()
-        return text
+                yield page.get_text()
+    
+    @staticmethod
+    @_serialized
+    def write_text(path, output_path):
+        """Streams a document's text to a UTF-8 file one page at a time.
+        
+        Only one page of text is held in memory. Returns (characters, words).
+        """
+        chars = words = 0
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            for text in PDFEngine._iter_text(path):
+                f.write(text)
+                chars += len(text)
+                words += len(text.split())
+        return chars, words
     
     @staticmethod
     def get_pdf_info(path):
-        """Gets metadata information about a PDF."""
-        doc = fitz.open(path)
-        info = {
-            'pages': len(doc),
-            'title': doc.metadata.get('title', 'N/A'),
-            'author': doc.metadata.get('author', 'N/A'),
-            'subject': doc.metadata.get('subject', 'N/A'),
-            'creator': doc.metadata.get('creator', 'N/A'),
-            'producer': doc.metadata.get('producer', 'N/A'),
-            'creation_date': doc.metadata.get('creationDate', 'N/A'),
-            'modification_date': doc.metadata.get('modDate', 'N/A'),
-            'encrypted': doc.is_encrypted
-        }
-        doc.close()
-        return info
+        """Gets metadata information about a PDF, cached until the file changes."""
+        st = os.stat(path)
+        # Copy so callers can't modify the cached entry
+        return dict(_pdf_info(path, st.st_size, st.st_mtime_ns))
     
     @staticmethod
+    @_serialized
     def rotate_pages(path, output_path, rotation=90, pages=None):
-        """Rotates specified pages or all pages by given degrees (90, 180, 270)."""
-        doc = fitz.open(path)
+        """Rotates specified pages or all pages by given degrees (90, 180, 270).
+        
+        Only the pages' /Rotate entries change, so the output is a copy of the
+        input with an incremental update appended instead of a full rewrite.
+        Returns the number of pages rotated.
+        """
+        if os.path.abspath(path) != os.path.abspath(output_path):
+            shutil.copyfile(path, output_path)
+        doc = fitz.open(output_path)
         if pages is None:
             pages = range(len(doc))
         
+        rotated = 0
         for page_num in pages:
             if page_num < len(doc):
                 page = doc.load_page(page_num)
                 page.set_rotation(rotation)
+                rotated += 1
         
-        doc.save(output_path)
-        doc.close()
-        return True
+        if doc.can_save_incrementally():
+            doc.save(output_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+            doc.close()
+        else:
+            # Damaged files are repaired on open and need a full rewrite
+            tmp = output_path + ".tmp"
+            doc.save(tmp)
+            doc.close()
+            os.replace(tmp, output_path)
+        return rotated
 
     @staticmethod
+    @_serialized
     def pdf_to_word(path, output_path):
         """Converts PDF to Word (.docx) using pdf2docx."""
         try:
+            # Office converters are imported on first use to keep startup fast
+            from pdf2docx import Converter
             cv = Converter(path)
             cv.convert(output_path, start=0, end=None)
             cv.close()
@@ -230,27 +817,37 @@ class PDFEngine:
             return False
 
     @staticmethod
-    def word_to_pdf(path, output_path):
-        """Converts Word (.docx) to PDF using LibreOffice."""
+    def _office_to_pdf(path, output_path, filter_name):
+        """Converts one office document to output_path.
+
+        Uses the long-running soffice over UNO when python-uno is installed, so
+        only the first conversion pays LibreOffice startup; otherwise runs the
+        LibreOffice CLI once for this file.
+        """
         try:
-            # LibreOffice headless conversion
-            output_dir = os.path.dirname(output_path)
+            if _uno_convert(path, output_path, filter_name):
+                return os.path.exists(output_path)
+        except Exception as e:
+            print(f"UNO conversion failed, retrying with LibreOffice CLI: {e}")
+        # LibreOffice names its output after the input; convert into a scratch
+        # directory so an unrelated <name>.pdf beside output_path is never
+        # overwritten, then move the result into place (possibly across drives)
+        with tempfile.TemporaryDirectory() as tmp:
             subprocess.run([
                 'libreoffice', '--headless', '--convert-to', 'pdf',
-                '--outdir', output_dir, path
+                '--outdir', tmp, path
             ], check=True)
-            
-            # LibreOffice saves with same basename, ensure output_path matches
-            # If output_path name is different from input basename + .pdf, rename it
-            base_name = os.path.splitext(os.path.basename(path))[0]
-            created_pdf = os.path.join(output_dir, f"{base_name}.pdf")
-            
-            if created_pdf != output_path and os.path.exists(created_pdf):
-                if os.path.exists(output_path):
-                    os.remove(output_path)
-                os.rename(created_pdf, output_path)
-                
-            return os.path.exists(output_path)
+            created_pdf = os.path.join(tmp, os.path.splitext(os.path.basename(path))[0] + ".pdf")
+            if not os.path.exists(created_pdf):
+                return False
+            shutil.move(created_pdf, output_path)
+        return True
+
+    @staticmethod
+    def word_to_pdf(path, output_path):
+        """Converts Word (.docx) to PDF using LibreOffice."""
+        try:
+            return PDFEngine._office_to_pdf(path, output_path, "writer_pdf_Export")
         except Exception as e:
             print(f"Error converting Word to PDF: {e}")
             return False
@@ -259,22 +856,21 @@ class PDFEngine:
     def pdf_to_excel(path, output_path):
         """Converts PDF tables to Excel (.xlsx) using pdfplumber."""
         try:
-            with pdfplumber.open(path) as pdf:
-                all_tables = []
-                for page in pdf.pages:
-                    tables = page.extract_tables()
-                    for table in tables:
-                        df = pd.DataFrame(table)
-                        # Clean up: remove empty rows/cols if needed
-                        all_tables.append(df)
-                
-                if not all_tables:
-                    # No tables found
-                    return False
-                
-                with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                    for i, df in enumerate(all_tables):
-                        df.to_excel(writer, sheet_name=f"Table_{i+1}", index=False, header=False)
+            from openpyxl import Workbook
+            # Table detection runs in worker processes; the workbook is written here
+            all_tables = _extract_tables(path)
+            
+            if not all_tables:
+                # No tables found
+                return False
+            
+            # Write-only mode streams whole rows instead of building a Cell per value
+            wb = Workbook(write_only=True)
+            for i, table in enumerate(all_tables):
+                ws = wb.create_sheet(f"Table_{i+1}")
+                for row in table:
+                    ws.append(row)
+            wb.save(output_path)
             return True
         except Exception as e:
             print(f"Error converting PDF to Excel: {e}")
@@ -284,21 +880,7 @@ class PDFEngine:
     def excel_to_pdf(path, output_path):
         """Converts Excel (.xlsx) to PDF using LibreOffice."""
         try:
-            output_dir = os.path.dirname(output_path)
-            subprocess.run([
-                'libreoffice', '--headless', '--convert-to', 'pdf',
-                '--outdir', output_dir, path
-            ], check=True)
-            
-            base_name = os.path.splitext(os.path.basename(path))[0]
-            created_pdf = os.path.join(output_dir, f"{base_name}.pdf")
-            
-            if created_pdf != output_path and os.path.exists(created_pdf):
-                if os.path.exists(output_path):
-                    os.remove(output_path)
-                os.rename(created_pdf, output_path)
-                
-            return os.path.exists(output_path)
+            return PDFEngine._office_to_pdf(path, output_path, "calc_pdf_Export")
         except Exception as e:
             print(f"Error converting Excel to PDF: {e}")
             return False
@@ -307,19 +889,21 @@ class PDFEngine:
     def pdf_to_powerpoint(path, output_path):
         """Converts PDF pages to PowerPoint slides (as images)."""
         try:
-            doc = fitz.open(path)
+            from pptx import Presentation
+            from pptx.util import Inches
             prs = Presentation()
             
             # Use 16:9 aspect ratio usually, but let's match PDF page size roughly
             # Default slide width is 10 inches, height is 7.5 inches
             
-            for i in range(len(doc)):
-                page = doc.load_page(i)
-                
-                # Render page to image
-                pix = page.get_pixmap(matrix=fitz.Matrix(2, 2)) # High res
-                img_data = pix.tobytes("png")
-                image_stream = io.BytesIO(img_data)
+            # Rendering is the slow part and runs in worker processes; python-pptx
+            # assembly stays here, in page order
+            pngs = _render_pngs(path, PDFEngine.get_page_count(path))
+            for i, png in enumerate(pngs):
+                # BytesIO shares png's buffer; python-pptx keeps its own copy, so
+                # drop ours right away rather than holding every page twice
+                pngs[i] = None
+                image_stream = io.BytesIO(png)
                 
                 # Create blank slide
                 result = prs.slides.add_slide(prs.slide_layouts[6]) # 6 is blank layout
@@ -338,7 +922,6 @@ class PDFEngine:
                 result.shapes.add_picture(image_stream, left, top, height=Inches(7.5))
                 
             prs.save(output_path)
-            doc.close()
             return True
         except Exception as e:
             print(f"Error converting PDF to PowerPoint: {e}")
@@ -348,21 +931,7 @@ class PDFEngine:
     def powerpoint_to_pdf(path, output_path):
         """Converts PowerPoint (.pptx) to PDF using LibreOffice."""
         try:
-            output_dir = os.path.dirname(output_path)
-            subprocess.run([
-                'libreoffice', '--headless', '--convert-to', 'pdf',
-                '--outdir', output_dir, path
-            ], check=True)
-            
-            base_name = os.path.splitext(os.path.basename(path))[0]
-            created_pdf = os.path.join(output_dir, f"{base_name}.pdf")
-            
-            if created_pdf != output_path and os.path.exists(created_pdf):
-                if os.path.exists(output_path):
-                    os.remove(output_path)
-                os.rename(created_pdf, output_path)
-                
-            return os.path.exists(output_path)
+            return PDFEngine._office_to_pdf(path, output_path, "impress_pdf_Export")
         except Exception as e:
             print(f"Error converting PowerPoint to PDF: {e}")
             return False